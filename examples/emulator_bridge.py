@@ -26,11 +26,16 @@ Protocol:
 from __future__ import annotations
 
 import argparse
+import functools
+import select
 import selectors
 import socket
+import struct
 import sys
 import os
+import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
@@ -41,7 +46,7 @@ from genesis_engine import GenesisBoard
 
 # Try to import zeroconf for mDNS
 try:
-    from zeroconf import ServiceInfo, Zeroconf
+    from zeroconf import IPVersion, ServiceInfo, Zeroconf
     HAS_ZEROCONF = True
 except ImportError:
     HAS_ZEROCONF = False
@@ -54,31 +59,76 @@ CMD_PSG_WRITE = 0x50
 CMD_YM2612_PORT0 = 0x52
 CMD_YM2612_PORT1 = 0x53
 CMD_END_STREAM = 0x66
+YM2612_REG_DAC = 0x2A   # Port 0 register that feeds the DAC
 FLOW_READY = 0x06
 BOARD_TYPE_PI = 6  # Raspberry Pi board type
 
+# Prebuilt control replies
+HANDSHAKE_REPLY = bytes((CMD_ACK, BOARD_TYPE_PI, FLOW_READY))  # Response to PING
+READY_REPLY = bytes((FLOW_READY,))                             # Response to END_STREAM
+
+# Report a closed peer as an error instead of raising SIGPIPE (Linux only)
+SEND_FLAGS = getattr(socket, "MSG_NOSIGNAL", 0)
+
+# Chip selectors for queued register writes (see GenesisBoard.write_batch)
+CHIP_YM2612_PORT0 = GenesisBoard.CHIP_YM2612_PORT0
+CHIP_YM2612_PORT1 = GenesisBoard.CHIP_YM2612_PORT1
+CHIP_PSG = GenesisBoard.CHIP_PSG
+
 # VGM wait commands
 CMD_WAIT = 0x61         # Wait N samples (16-bit little-endian)
 CMD_WAIT_60 = 0x62      # Wait 735 samples (1/60 sec)
 CMD_WAIT_50 = 0x63      # Wait 882 samples (1/50 sec)
 CMD_WAIT_SHORT_BASE = 0x70  # 0x70-0x7F: wait 1-16 samples
 
+# Sample counts for the fixed-length wait commands, indexed by command byte
+# (0 for commands that aren't fixed-length waits)
+WAIT_SAMPLES_TABLE = [0] * 256
+WAIT_SAMPLES_TABLE[CMD_WAIT_60] = 735
+WAIT_SAMPLES_TABLE[CMD_WAIT_50] = 882
+for _cmd in range(CMD_WAIT_SHORT_BASE, CMD_WAIT_SHORT_BASE + 16):
+    WAIT_SAMPLES_TABLE[_cmd] = (_cmd & 0x0F) + 1
+del _cmd
+
+# 16-bit little-endian operand of CMD_WAIT, read straight from the receive buffer
+UNPACK_U16LE = struct.Struct("<H").unpack_from
+
 # Sample rate for timing (VGM standard)
 SAMPLE_RATE = 44100
-SAMPLES_TO_SECONDS = 1.0 / SAMPLE_RATE
+
+# Timing tolerances (nanoseconds)
+TIMING_TOLERANCE_NS = 50_000   # Execute immediately if within 50µs of target
+SPIN_THRESHOLD_NS = 200_000    # Sleep until 200µs before target, then spin
+MAX_LEAD_NS = 50_000_000       # How far the stream may run ahead of the writer thread
 
 # Network defaults
 DEFAULT_TCP_PORT = 7654
+RXBUF_SIZE = 131072              # Per-client receive buffer size
+CLIENT_RCVBUF_SIZE = 1 << 20     # SO_RCVBUF for accepted client sockets
+FD_TABLE_SIZE = 1024             # Initial size of the fd -> client lookup table
 SERVICE_NAME = "GenesisEngine"
 SERVICE_TYPE = "_genesis-audio._tcp.local."
 
+# Poll event bits. epoll (Linux) is the fast path; elsewhere _SelectorPoll
+# stands in with the same interface, level-triggered only.
+if hasattr(select, "epoll"):
+    POLL_IN = select.EPOLLIN
+    POLL_OUT = select.EPOLLOUT
+    POLL_EDGE = select.EPOLLET
+else:
+    POLL_IN = selectors.EVENT_READ
+    POLL_OUT = selectors.EVENT_WRITE
+    POLL_EDGE = 0
 
+
+@functools.lru_cache(maxsize=1)
 def get_local_ip() -> str:
-    """Get the local IP address for mDNS registration."""
+    """Get the local IP address for mDNS registration (cached after first call)."""
     try:
         # Connect to a public address to determine local IP
         # (doesn't actually send data)
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.settimeout(0.1)  # Fail fast when offline
         s.connect(("8.8.8.8", 80))
         ip = s.getsockname()[0]
         s.close()
@@ -87,31 +137,148 @@ def get_local_ip() -> str:
         return "127.0.0.1"
 
 
+class _SelectorPoll:
+    """select.epoll look-alike on top of selectors, for platforms without epoll."""
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+
+    def register(self, fd: int, mask: int) -> None:
+        """Watch fd for the events in mask."""
+        self._selector.register(fd, mask)
+
+    def modify(self, fd: int, mask: int) -> None:
+        """Change the events watched on fd."""
+        self._selector.modify(fd, mask)
+
+    def unregister(self, fd: int) -> None:
+        """Stop watching fd (ValueError if it isn't registered)."""
+        try:
+            self._selector.unregister(fd)
+        except KeyError:
+            raise ValueError(f"fd {fd} is not registered") from None
+
+    def poll(self, timeout: Optional[float] = None) -> list:
+        """Wait for events, returning (fd, mask) pairs like epoll.poll()."""
+        return [(key.fd, events) for key, events in self._selector.select(timeout)]
+
+    def close(self) -> None:
+        """Release the underlying selector."""
+        self._selector.close()
+
+
+class ClientState:
+    """Per-connection state for a bridge client."""
+
+    __slots__ = (
+        "conn",
+        "addr",
+        "connected",
+        "dispatch",
+        "start_time_ns",
+        "elapsed_samples",
+        "lead_check_samples",
+        "rxbuf",
+        "rxview",
+        "rxlen",
+        "pending",
+        "tx",
+        "tx_blocked",
+    )
+
+    def __init__(self, conn: socket.socket, addr, dispatch: list) -> None:
+        self.conn = conn
+        self.addr = addr
+        self.connected = False          # Handshake (PING) completed
+        self.dispatch = dispatch        # Command handler table for the current state
+        self.start_time_ns = 0          # When playback started (monotonic_ns)
+        self.elapsed_samples = 0        # Total samples elapsed in the stream
+        self.lead_check_samples = 0     # Re-check the lead once elapsed_samples passes this
+        self.rxbuf = bytearray(RXBUF_SIZE)      # Receive buffer, filled by recv_into()
+        self.rxview = memoryview(self.rxbuf)
+        self.rxlen = 0                          # Bytes received but not yet parsed
+        self.pending: list = []         # Register writes queued until the next wait
+        self.tx = bytearray()           # Control replies not yet sent
+        self.tx_blocked = False         # Waiting for POLL_OUT to send the rest of tx
+
+
 class EmulatorBridge:
-    """Bridge between BlastEm emulator and GenesisBoard."""
+    """
+    Bridge between BlastEm emulator and GenesisBoard.
+
+    One emulator streams at a time. The chips and the writer queue are shared,
+    so while a client is streaming, another client's PING is refused by
+    closing that connection without an ACK.
+    """
 
     SOCKET_PATH = "/tmp/genesis_bridge.sock"
 
-    def __init__(self, tcp_port: int = DEFAULT_TCP_PORT, enable_unix: bool = True):
+    def __init__(
+        self,
+        tcp_port: int = DEFAULT_TCP_PORT,
+        enable_unix: bool = True,
+        mdns_all_interfaces: bool = False,
+        verbose: bool = False,
+    ):
         """Initialize bridge.
 
         Args:
             tcp_port: TCP port to listen on (default 7654)
             enable_unix: Also listen on Unix domain socket (Linux only)
+            mdns_all_interfaces: Run mDNS on every interface instead of only the
+                one with the default route (for multi-homed hosts)
+            verbose: Log per-stream protocol events (PING, END_STREAM)
         """
         self.board = GenesisBoard()
         self.tcp_port = tcp_port
         self.enable_unix = enable_unix and (os.name != 'nt')  # Unix sockets not on Windows
+        self.mdns_all_interfaces = mdns_all_interfaces
+        self.verbose = verbose
 
         self.tcp_sock: Optional[socket.socket] = None
         self.unix_sock: Optional[socket.socket] = None
-        self.selector = selectors.DefaultSelector()
+        # Poll set for all sockets (epoll on Linux). Clients are looked up by
+        # fd in a plain list on the hot path; the few server sockets live in a dict.
+        self._poll = select.epoll() if hasattr(select, "epoll") else _SelectorPoll()
+        self._fd_clients: list = [None] * FD_TABLE_SIZE
+        self._server_fds: dict[int, tuple[socket.socket, str]] = {}
 
         self.zeroconf: Optional[Zeroconf] = None
         self.service_info: Optional[ServiceInfo] = None
 
         # Active client connections
-        self.clients: dict[socket.socket, dict] = {}
+        self.clients: dict[socket.socket, ClientState] = {}
+        self._rcvbuf_warned = False
+
+        # Board calls waiting for the writer thread: (deadline_ns, func, args)
+        self._queue: deque = deque()
+        self._queue_event = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_running = False
+
+        # Clients whose END_STREAM reset has run, waiting for READY. The writer
+        # thread appends here and pokes _wake_w; the network thread sends.
+        self._ready_clients: deque = deque()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._poll.register(self._wake_r.fileno(), POLL_IN)
+
+        # Command dispatch tables, indexed by command byte. Clients start on
+        # the pre-handshake table (PING only) and switch once PING arrives.
+        self._dispatch_pre_handshake = [self._op_reject] * 256
+        self._dispatch_pre_handshake[CMD_PING] = self._op_ping
+
+        self._dispatch_active = [self._op_nop] * 256
+        self._dispatch_active[CMD_PING] = self._op_ping
+        self._dispatch_active[CMD_PSG_WRITE] = self._op_writes
+        self._dispatch_active[CMD_YM2612_PORT0] = self._op_writes
+        self._dispatch_active[CMD_YM2612_PORT1] = self._op_writes
+        self._dispatch_active[CMD_END_STREAM] = self._op_end
+        self._dispatch_active[CMD_WAIT] = self._op_wait_n
+        for cmd, samples in enumerate(WAIT_SAMPLES_TABLE):
+            if samples:
+                self._dispatch_active[cmd] = self._op_wait_fixed
 
     def start_servers(self) -> None:
         """Start TCP and Unix domain socket servers."""
@@ -121,7 +288,7 @@ class EmulatorBridge:
         self.tcp_sock.bind(("0.0.0.0", self.tcp_port))
         self.tcp_sock.listen(5)
         self.tcp_sock.setblocking(False)
-        self.selector.register(self.tcp_sock, selectors.EVENT_READ, data="tcp_accept")
+        self._register_server(self.tcp_sock, "tcp_accept")
 
         local_ip = get_local_ip()
         print(f"TCP server listening on {local_ip}:{self.tcp_port}")
@@ -135,10 +302,22 @@ class EmulatorBridge:
             self.unix_sock.bind(self.SOCKET_PATH)
             self.unix_sock.listen(5)
             self.unix_sock.setblocking(False)
-            self.selector.register(self.unix_sock, selectors.EVENT_READ, data="unix_accept")
+            self._register_server(self.unix_sock, "unix_accept")
 
             print(f"Unix socket listening on {self.SOCKET_PATH}")
 
+    def _register_server(self, sock: socket.socket, conn_type: str) -> None:
+        """Watch a listening socket for incoming connections."""
+        fd = sock.fileno()
+        self._server_fds[fd] = (sock, conn_type)
+        self._poll.register(fd, POLL_IN)
+
+    def _unregister_server(self, sock: socket.socket) -> None:
+        """Stop watching a listening socket."""
+        fd = sock.fileno()
+        self._server_fds.pop(fd, None)
+        self._poll.unregister(fd)
+
     def register_mdns(self) -> None:
         """Register service with mDNS for auto-discovery."""
         if not HAS_ZEROCONF:
@@ -162,7 +341,13 @@ class EmulatorBridge:
                 server=f"{hostname}.local.",
             )
 
-            self.zeroconf = Zeroconf()
+            # By default only listen on the interface we advertise, IPv4 only.
+            # Zeroconf's threads wake on every multicast packet they see, and
+            # that's CPU stolen from the timing loop.
+            if self.mdns_all_interfaces:
+                self.zeroconf = Zeroconf()
+            else:
+                self.zeroconf = Zeroconf(interfaces=[local_ip], ip_version=IPVersion.V4Only)
             self.zeroconf.register_service(self.service_info)
 
             print(f"mDNS registered as: {hostname}.local")
@@ -177,158 +362,401 @@ class EmulatorBridge:
         conn, addr = sock.accept()
         conn.setblocking(False)
 
+        # Bigger receive buffer so bursts arrive in fewer, larger reads
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, CLIENT_RCVBUF_SIZE)
+        # The kernel silently caps this at net.core.rmem_max
+        rcvbuf = conn.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        if rcvbuf < CLIENT_RCVBUF_SIZE and not self._rcvbuf_warned:
+            self._rcvbuf_warned = True
+            print(f"Warning: socket receive buffer limited to {rcvbuf} bytes "
+                  f"(raise net.core.rmem_max to at least {CLIENT_RCVBUF_SIZE})")
+
         if conn_type == "tcp_accept":
+            # Disable Nagle so small control replies (ACK/READY) go out at once
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             print(f"TCP client connected from {addr[0]}:{addr[1]}")
         else:
             print("Unix socket client connected")
 
-        self.selector.register(conn, selectors.EVENT_READ, data="client")
-        self.clients[conn] = {
-            "connected": False,
-            "addr": addr,
-            "start_time": 0.0,      # When playback started (perf_counter)
-            "elapsed_samples": 0,   # Total samples elapsed in the stream
-        }
+        client = ClientState(conn, addr, self._dispatch_pre_handshake)
+        self.clients[conn] = client
+
+        fd = conn.fileno()
+        if fd >= len(self._fd_clients):
+            self._fd_clients.extend([None] * (fd + 1 - len(self._fd_clients)))
+        self._fd_clients[fd] = client
+        # Edge-triggered where supported: handle_client always reads until EAGAIN
+        self._poll.register(fd, POLL_IN | POLL_EDGE)
+
+    @staticmethod
+    def _target_ns(client: ClientState) -> int:
+        """Where the client's stream currently is on the global timeline."""
+        return client.start_time_ns + client.elapsed_samples * 1_000_000_000 // SAMPLE_RATE
 
-    def _wait_for_timing(self, client: dict) -> None:
-        """Wait until it's time to execute the next command (absolute timing)."""
-        # Calculate where we SHOULD be on the global timeline
-        target_time = client["start_time"] + client["elapsed_samples"] * SAMPLES_TO_SECONDS
-        now = time.perf_counter()
+    @staticmethod
+    def _wait_until(target_ns: int) -> None:
+        """Wait until a point on the timeline is reached (absolute timing)."""
+        remaining_ns = target_ns - time.monotonic_ns()
 
         # If we're behind or within 50µs tolerance, execute immediately (reduces jitter)
-        if now >= target_time - 0.00005:
+        if remaining_ns <= TIMING_TOLERANCE_NS:
             return
 
-        # Only busy-wait if we're significantly ahead
-        while time.perf_counter() < target_time:
+        # Sleep through the bulk of long waits so we don't burn a core
+        if remaining_ns > SPIN_THRESHOLD_NS:
+            time.sleep((remaining_ns - SPIN_THRESHOLD_NS) / 1_000_000_000)
+
+        # Busy-wait the last stretch for accuracy
+        while time.monotonic_ns() < target_ns:
             pass
 
-    def _add_wait_samples(self, client: dict, samples: int) -> None:
+    def _add_wait_samples(self, client: ClientState, samples: int) -> None:
         """Add samples to elapsed count (absolute timing - no drift)."""
-        client["elapsed_samples"] += samples
+        self._flush_pending(client)
+        client.elapsed_samples += samples
+        if client.elapsed_samples > client.lead_check_samples:
+            self._throttle(client)
+
+    def _flush_pending(self, client: ClientState) -> None:
+        """Hand the queued register writes to the writer thread."""
+        pending = client.pending
+        if pending:
+            self._schedule(self._target_ns(client), self._write_batch, (pending,))
+            client.pending = []
+
+    def _schedule(self, deadline_ns: int, func, args: tuple) -> None:
+        """Queue a board call for the writer thread (deadline 0 = immediately)."""
+        self._queue.append((deadline_ns, func, args))
+        self._queue_event.set()
+
+    def _throttle(self, client: ClientState) -> None:
+        """
+        Don't let the stream run too far ahead of the writer thread.
 
-    def handle_client(self, conn: socket.socket) -> bool:
-        """Handle data from a client. Returns False if client disconnected."""
+        Called from the wait handlers whenever elapsed_samples passes
+        lead_check_samples, so even a single large chunk can't schedule more
+        than MAX_LEAD_NS ahead.
+        """
+        self._queue_event.set()  # Let the writer start on what's queued
+        now_ns = time.monotonic_ns()
+        lead_ns = self._target_ns(client) - now_ns
+        if lead_ns > MAX_LEAD_NS:
+            time.sleep((lead_ns - MAX_LEAD_NS) / 1_000_000_000)
+            now_ns = time.monotonic_ns()
+        # Nothing to check until the stream is MAX_LEAD_NS past the clock again
+        client.lead_check_samples = (
+            (now_ns + MAX_LEAD_NS - client.start_time_ns) * SAMPLE_RATE // 1_000_000_000
+        )
+
+    def _start_writer(self) -> None:
+        """Start the thread that performs all board writes."""
+        self._writer_running = True
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
+    def _stop_writer(self) -> None:
+        """Stop the writer thread, dropping anything still queued."""
+        if self._writer is None:
+            return
+        self._writer_running = False
+        self._queue_event.set()
+        self._writer.join()
+        self._writer = None
+        self._queue.clear()
+
+    def _writer_loop(self) -> None:
+        """
+        Writer thread: perform queued board calls at their scheduled time.
+
+        Keeps SPI/GPIO work and timing waits off the network thread, so a slow
+        bus write never delays the next recv().
+        """
+        queue = self._queue
+        event = self._queue_event
+        wait_until = self._wait_until
+
+        while self._writer_running:
+            if not queue:
+                event.wait()
+                event.clear()
+                continue
+            deadline_ns, func, args = queue.popleft()
+            if deadline_ns:
+                wait_until(deadline_ns)
+            try:
+                func(*args)
+            except Exception as e:
+                # A failing bus won't recover by itself. Stop the bridge rather
+                # than let the network thread queue writes nobody will make.
+                print(f"ERROR: board write failed, stopping bridge: {e}")
+                self._writer_running = False
+
+    def _end_stream(self, client: ClientState) -> None:
+        """Writer thread: reset the chips after a stream's last write, then signal READY."""
+        self._reset()
+        self._ready_clients.append(client)
         try:
-            data = conn.recv(1)
-            if not data:
+            self._wake_w.send(b"\0")
+        except BlockingIOError:
+            pass  # Wakeup already pending
+
+    def _send_ready(self) -> None:
+        """Send READY to every client whose END_STREAM reset has run."""
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+        while self._ready_clients:
+            client = self._ready_clients.popleft()
+            if self.clients.get(client.conn) is not client:
+                continue  # Disconnected meanwhile
+            client.tx += READY_REPLY
+            if not self._flush_tx(client):
+                self.remove_client(client.conn)
+
+    def handle_client(self, client: ClientState) -> bool:
+        """Handle data from a client. Returns False if client disconnected."""
+        conn = client.conn
+        rxview = client.rxview
+
+        # Keep reading until the socket is drained (EAGAIN). Under epoll the
+        # socket is edge-triggered, so data left behind here isn't reported again.
+        while True:
+            # Nothing plays once the writer thread has stopped
+            if not self._writer_running:
+                return False
+
+            try:
+                n = conn.recv_into(rxview[client.rxlen:])
+            except BlockingIOError:
+                return True
+            except (ConnectionResetError, BrokenPipeError, OSError):
+                return False
+            if not n:
                 return False
+            client.rxlen += n
 
-            cmd = data[0]
-            client = self.clients[conn]
+            if not self._process_buffer(client):
+                return False
 
-            # PING - connection handshake
-            if cmd == CMD_PING:
-                print("Received PING, sending ACK")
-                self.board.reset()
-                conn.send(bytes([CMD_ACK, BOARD_TYPE_PI, FLOW_READY]))
-                client["connected"] = True
-                client["start_time"] = time.perf_counter()  # Global clock reference
-                client["elapsed_samples"] = 0
+            # One send for all replies produced by this chunk
+            if client.tx and not self._flush_tx(client):
+                return False
 
-            # PSG write
-            elif cmd == CMD_PSG_WRITE:
-                val = self._recv_byte(conn)
-                if val is not None and client["connected"]:
-                    self._wait_for_timing(client)
-                    self.board.write_psg(val)
-
-            # YM2612 port 0
-            elif cmd == CMD_YM2612_PORT0:
-                data = self._recv_bytes(conn, 2)
-                if data and client["connected"]:
-                    self._wait_for_timing(client)
-                    reg, val = data[0], data[1]
-                    if reg == 0x2A:  # DAC data
-                        self.board.write_dac(val)
-                    else:
-                        self.board.write_ym2612(0, reg, val)
-
-            # YM2612 port 1
-            elif cmd == CMD_YM2612_PORT1:
-                data = self._recv_bytes(conn, 2)
-                if data and client["connected"]:
-                    self._wait_for_timing(client)
-                    reg, val = data[0], data[1]
-                    self.board.write_ym2612(1, reg, val)
-
-            # End stream
-            elif cmd == CMD_END_STREAM:
-                print("Received END_STREAM, resetting")
-                self.board.reset()
-                client["start_time"] = time.perf_counter()  # Reset global clock
-                client["elapsed_samples"] = 0
-                conn.send(bytes([FLOW_READY]))
-
-            # Wait N samples (16-bit little-endian)
-            elif cmd == CMD_WAIT:
-                data = self._recv_bytes(conn, 2)
-                if data and client["connected"]:
-                    samples = data[0] | (data[1] << 8)
-                    self._add_wait_samples(client, samples)
-
-            # Wait 735 samples (1/60 sec)
-            elif cmd == CMD_WAIT_60:
-                if client["connected"]:
-                    self._add_wait_samples(client, 735)
-
-            # Wait 882 samples (1/50 sec)
-            elif cmd == CMD_WAIT_50:
-                if client["connected"]:
-                    self._add_wait_samples(client, 882)
-
-            # Short wait 0x70-0x7F: wait 1-16 samples
-            elif CMD_WAIT_SHORT_BASE <= cmd <= 0x7F:
-                if client["connected"]:
-                    samples = (cmd & 0x0F) + 1
-                    self._add_wait_samples(client, samples)
-
-            return True
+    def _flush_tx(self, client: ClientState) -> bool:
+        """
+        Send queued control replies. Returns False on socket error.
 
+        If the send buffer is full, the client is also watched for POLL_OUT
+        until the rest has gone, so a reply can't sit unsent while the client
+        waits for it.
+        """
+        tx = client.tx
+        try:
+            sent = client.conn.send(tx, SEND_FLAGS)
+        except BlockingIOError:
+            sent = 0
         except (ConnectionResetError, BrokenPipeError, OSError):
             return False
+        del tx[:sent]
 
-    def _recv_byte(self, conn: socket.socket) -> Optional[int]:
-        """Receive a single byte (blocking until available)."""
-        try:
-            # Temporarily block to ensure we get the byte
-            conn.setblocking(True)
-            data = conn.recv(1)
-            conn.setblocking(False)
-            return data[0] if data else None
-        except OSError:
-            conn.setblocking(False)
-            return None
+        blocked = bool(tx)
+        if blocked != client.tx_blocked:
+            mask = POLL_IN | POLL_EDGE
+            if blocked:
+                mask |= POLL_OUT
+            try:
+                self._poll.modify(client.conn.fileno(), mask)
+            except (OSError, ValueError):
+                return False
+            client.tx_blocked = blocked
+        return True
+
+    def _process_buffer(self, client: ClientState) -> bool:
+        """Parse a client's received bytes. Returns False on socket or protocol error."""
+        buf = client.rxbuf
+        end = client.rxlen
+        pos = 0
 
-    def _recv_bytes(self, conn: socket.socket, count: int) -> Optional[bytes]:
-        """Receive exactly count bytes (blocking until all received)."""
         try:
-            # Temporarily block to ensure we get all bytes
-            # This prevents dropped samples during high-rate DAC streaming
-            conn.setblocking(True)
-            data = b""
-            while len(data) < count:
-                chunk = conn.recv(count - len(data))
-                if not chunk:
-                    conn.setblocking(False)
-                    return None
-                data += chunk
-            conn.setblocking(False)
-            return data
-        except OSError:
-            conn.setblocking(False)
-            return None
+            # Parse every complete command in the buffer. Handlers return -1
+            # when operands haven't fully arrived; those stay buffered.
+            # (The table is re-read each time since PING switches it.)
+            while pos < end:
+                new_pos = client.dispatch[buf[pos]](client, buf, pos)
+                if new_pos < 0:
+                    break
+                pos = new_pos
+            # Don't hold writes back until the next wait arrives
+            self._flush_pending(client)
+        except (ConnectionResetError, BrokenPipeError, OSError):
+            return False
+
+        # Move the unparsed tail (at most one partial command) to the front
+        rest = end - pos
+        if rest:
+            client.rxview[:rest] = client.rxview[pos:end]
+        client.rxlen = rest
+
+        return True
+
+    # Command handlers - each takes (client, buf, pos) with buf[pos] being the
+    # command byte, and returns the position after the command, or -1 if the
+    # command's operands aren't fully buffered yet (buf is valid up to
+    # client.rxlen).
+
+    def _op_nop(self, client: ClientState, buf: bytearray, pos: int) -> int:
+        """Unknown byte - skip it."""
+        return pos + 1
+
+    def _op_reject(self, client: ClientState, buf: bytearray, pos: int) -> int:
+        """Anything but PING before the handshake - drop the client."""
+        print(f"Unexpected command 0x{buf[pos]:02X} before PING")
+        raise ConnectionAbortedError("protocol error")
+
+    def _op_ping(self, client: ClientState, buf: bytearray, pos: int) -> int:
+        """PING - connection handshake. Refused while another client is streaming."""
+        for other in self.clients.values():
+            if other is not client and other.connected:
+                print(f"Refusing {client.addr}: {other.addr} is already streaming")
+                raise ConnectionRefusedError("bridge busy")
+        if self.verbose:
+            print("Received PING, sending ACK")
+        # Chips are about to be reset, so drop anything not yet written
+        self._queue.clear()
+        client.pending = []
+        self._schedule(0, self._reset, ())
+        client.tx += HANDSHAKE_REPLY
+        client.connected = True
+        client.dispatch = self._dispatch_active
+        client.start_time_ns = time.monotonic_ns()  # Global clock reference
+        client.elapsed_samples = 0
+        client.lead_check_samples = 0
+        return pos + 1
+
+    def _op_writes(self, client: ClientState, buf: bytearray, pos: int) -> int:
+        """
+        Register writes: PSG, YM2612 port 0 and YM2612 port 1.
+
+        Writes arrive in runs between waits, so this consumes the whole run in
+        one call instead of going back through the dispatch table per command.
+        """
+        start = pos
+        end = client.rxlen
+        append = client.pending.append
+
+        while pos < end:
+            cmd = buf[pos]
+            if cmd == CMD_YM2612_PORT0:
+                if end - pos < 3:
+                    break
+                if buf[pos + 1] == YM2612_REG_DAC:
+                    pos = self._dac_run(client, buf, pos, end)
+                    append = client.pending.append  # _dac_run flushed the old list
+                    continue
+                append((CHIP_YM2612_PORT0, buf[pos + 1], buf[pos + 2]))
+                pos += 3
+            elif cmd == CMD_YM2612_PORT1:
+                if end - pos < 3:
+                    break
+                append((CHIP_YM2612_PORT1, buf[pos + 1], buf[pos + 2]))
+                pos += 3
+            elif cmd == CMD_PSG_WRITE:
+                if end - pos < 2:
+                    break
+                append((CHIP_PSG, 0, buf[pos + 1]))
+                pos += 2
+            else:
+                break
+
+        # Only report "need more data" if not even the first write was complete
+        return pos if pos > start else -1
+
+    def _dac_run(self, client: ClientState, buf: bytearray, pos: int, end: int) -> int:
+        """
+        Stream DAC samples starting at a port 0 write to register 0x2A.
+
+        Sampled audio arrives as DAC write + short wait pairs. Each sample has
+        its own timestamp, so each is scheduled straight to write_dac() in a
+        tight loop (skipping the pending list) until the pattern breaks.
+
+        Returns:
+            Position after the last DAC write (and its wait) consumed
+        """
+        # Anything queued shares the first sample's timestamp and goes first
+        self._flush_pending(client)
+
+        write_dac = self._write_dac
+        queue_append = self._queue.append
+        wait_table = WAIT_SAMPLES_TABLE
+        start_ns = client.start_time_ns
+        elapsed = client.elapsed_samples
+        check = client.lead_check_samples
+
+        while (
+            end - pos >= 3
+            and buf[pos] == CMD_YM2612_PORT0
+            and buf[pos + 1] == YM2612_REG_DAC
+        ):
+            if elapsed > check:
+                client.elapsed_samples = elapsed
+                self._throttle(client)
+                check = client.lead_check_samples
+            deadline_ns = start_ns + elapsed * 1_000_000_000 // SAMPLE_RATE
+            queue_append((deadline_ns, write_dac, (buf[pos + 2],)))
+            pos += 3
+            if pos < end:
+                samples = wait_table[buf[pos]]
+                if samples:
+                    elapsed += samples
+                    pos += 1
+
+        client.elapsed_samples = elapsed
+        self._queue_event.set()
+        return pos
+
+    def _op_end(self, client: ClientState, buf: bytearray, pos: int) -> int:
+        """End stream - reset chips and restart the clock. READY follows the reset."""
+        if self.verbose:
+            print("Received END_STREAM, resetting")
+        self._flush_pending(client)
+        target_ns = self._target_ns(client)
+        self._schedule(target_ns, self._end_stream, (client,))
+        # Reset global clock, starting after anything still queued has played
+        client.start_time_ns = max(time.monotonic_ns(), target_ns)
+        client.elapsed_samples = 0
+        client.lead_check_samples = 0
+        return pos + 1
+
+    def _op_wait_n(self, client: ClientState, buf: bytearray, pos: int) -> int:
+        """Wait N samples (16-bit little-endian)."""
+        if client.rxlen - pos < 3:
+            return -1
+        self._add_wait_samples(client, UNPACK_U16LE(buf, pos + 1)[0])
+        return pos + 3
+
+    def _op_wait_fixed(self, client: ClientState, buf: bytearray, pos: int) -> int:
+        """Fixed-length waits: 0x62 (1/60 sec), 0x63 (1/50 sec), 0x70-0x7F (1-16 samples)."""
+        self._add_wait_samples(client, WAIT_SAMPLES_TABLE[buf[pos]])
+        return pos + 1
 
     def remove_client(self, conn: socket.socket) -> None:
         """Remove a disconnected client."""
-        addr = self.clients.get(conn, {}).get("addr", "unknown")
+        client = self.clients.get(conn)
+        addr = client.addr if client else "unknown"
         print(f"Client disconnected: {addr}")
 
-        try:
-            self.selector.unregister(conn)
-        except (KeyError, ValueError):
-            pass
+        fd = conn.fileno()
+        if fd >= 0:
+            try:
+                self._poll.unregister(fd)
+            except (OSError, ValueError):
+                pass
+            if fd < len(self._fd_clients):
+                self._fd_clients[fd] = None
 
         try:
             conn.close()
@@ -340,7 +768,7 @@ class EmulatorBridge:
 
         # Reset hardware when last client disconnects
         if not self.clients:
-            self.board.reset()
+            self._schedule(0, self._reset, ())
 
     def cleanup(self) -> None:
         """Clean up resources."""
@@ -359,23 +787,26 @@ class EmulatorBridge:
         # Close server sockets
         if self.tcp_sock:
             try:
-                self.selector.unregister(self.tcp_sock)
+                self._unregister_server(self.tcp_sock)
                 self.tcp_sock.close()
-            except Exception:
+            except (OSError, ValueError):
                 pass
 
         if self.unix_sock:
             try:
-                self.selector.unregister(self.unix_sock)
+                self._unregister_server(self.unix_sock)
                 self.unix_sock.close()
-            except Exception:
+            except (OSError, ValueError):
                 pass
             if os.path.exists(self.SOCKET_PATH):
                 os.unlink(self.SOCKET_PATH)
 
-        self.selector.close()
+        self._poll.close()
 
-        # Cleanup hardware
+        # Cleanup hardware (writer thread first, so nothing else touches the board)
+        self._stop_writer()
+        self._wake_r.close()
+        self._wake_w.close()
         self.board.mute_all()
         self.board.cleanup()
 
@@ -394,6 +825,13 @@ class EmulatorBridge:
             print(f"ERROR: {e}")
             return
 
+        # Bind board methods once so command handlers skip the attribute lookups
+        self._write_batch = self.board.write_batch
+        self._write_dac = self.board.write_dac
+        self._reset = self.board.reset
+
+        self._start_writer()
+
         print()
 
         # Start servers
@@ -406,18 +844,26 @@ class EmulatorBridge:
             print("(Press Ctrl+C to quit)")
             print()
 
-            while True:
-                # Wait for events on any socket
-                events = self.selector.select(timeout=1.0)
+            poll = self._poll.poll
+            fd_clients = self._fd_clients
+            wake_fd = self._wake_r.fileno()
 
-                for key, mask in events:
-                    if key.data == "tcp_accept":
-                        self.accept_connection(key.fileobj, "tcp_accept")
-                    elif key.data == "unix_accept":
-                        self.accept_connection(key.fileobj, "unix_accept")
-                    elif key.data == "client":
-                        if not self.handle_client(key.fileobj):
-                            self.remove_client(key.fileobj)
+            # Runs until Ctrl+C, or until the writer thread stops on a board error
+            while self._writer_running:
+                # Wait for events on any socket
+                for fd, mask in poll(1.0):
+                    client = fd_clients[fd] if fd < len(fd_clients) else None
+                    if client is not None:
+                        # Finish any reply left over from a full send buffer first
+                        if client.tx and not self._flush_tx(client):
+                            self.remove_client(client.conn)
+                        elif not self.handle_client(client):
+                            self.remove_client(client.conn)
+                    elif fd == wake_fd:
+                        self._send_ready()
+                    elif fd in self._server_fds:
+                        sock, conn_type = self._server_fds[fd]
+                        self.accept_connection(sock, conn_type)
 
         except KeyboardInterrupt:
             print("\nShutting down...")
@@ -438,17 +884,30 @@ def main():
         default=DEFAULT_TCP_PORT,
         help=f"TCP port to listen on (default: {DEFAULT_TCP_PORT})"
     )
+    parser.add_argument(
+        "--mdns-all-interfaces",
+        action="store_true",
+        help="Advertise via mDNS on all network interfaces (default: primary interface only)"
+    )
     parser.add_argument(
         "--no-unix",
         action="store_true",
         help="Disable Unix domain socket (Linux only)"
     )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        default=os.environ.get("BRIDGE_VERBOSE", "0") not in ("", "0"),
+        help="Log PING/END_STREAM events (default: off, or set BRIDGE_VERBOSE=1)"
+    )
 
     args = parser.parse_args()
 
     bridge = EmulatorBridge(
         tcp_port=args.port,
-        enable_unix=not args.no_unix
+        enable_unix=not args.no_unix,
+        mdns_all_interfaces=args.mdns_all_interfaces,
+        verbose=args.verbose,
     )
     bridge.run()
 
@@ -37,22 +37,32 @@ Playlist Format:
     - filename,N - play track N times (uses loop points)
 """
 
+import os
 import sys
 import time
+import queue
 import random
+import selectors
 import threading
-from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional
 
 # Add parent directory to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from genesis_engine import GenesisEngine, GenesisBoard, EngineState
 
+# Music file suffixes, matched case-insensitively
+MUSIC_EXTENSIONS = (".vgm", ".vgz")
 
-@dataclass
-class PlaylistEntry:
+# Playlist directives: name -> (Jukebox flag to set, message)
+PLAYLIST_DIRECTIVES = {
+    "shuffle": ("playlist_shuffle", "Shuffle: ON"),
+    "loop": ("playlist_loop", "Loop: ON"),
+}
+
+
+class PlaylistEntry(NamedTuple):
     """A single track in a playlist."""
     file_index: int  # Index into files list
     plays: int       # How many times to play this track
@@ -75,18 +85,28 @@ class Jukebox:
         self.board = GenesisBoard()
         self.player = GenesisEngine(self.board)
         self.files: List[Path] = []
+        # Display names parallel to files, rebuilt by scan_files()
+        self._file_names: List[str] = []
         self.playlists: List[Path] = []
+        # Lowercased file name -> index into files, rebuilt by scan_files()
+        self._name_index: Dict[str, int] = {}
         self.current_index: int = -1
         self.running = False
+        self._was_playing = False
+        self._prompt_shown = False
 
         # Playlist state
         self.playlist_active = False
         self.playlist_entries: List[PlaylistEntry] = []
+        # Play order as indices into playlist_entries (shuffled, not the entries)
+        self.playlist_order: List[int] = []
         self.playlist_pos: int = 0
         self.playlist_shuffle = False
         self.playlist_loop = False
         self.current_plays: int = 0
-        self.last_loop_count: int = 0
+        # Set by the loop callback once the current track has had all its plays
+        self._track_done = False
+        self.player.on_loop = self._on_loop
 
     def scan_files(self) -> None:
         """Scan for VGM/VGZ files."""
@@ -94,12 +114,19 @@ class Jukebox:
 
         self.files = []
         if self.music_dir.exists():
-            self.files = sorted(
-                list(self.music_dir.glob("*.vgm")) +
-                list(self.music_dir.glob("*.VGM")) +
-                list(self.music_dir.glob("*.vgz")) +
-                list(self.music_dir.glob("*.VGZ"))
-            )
+            # One directory pass; the lowercased suffix check covers .VGM/.VGZ too
+            with os.scandir(self.music_dir) as it:
+                self.files = sorted(
+                    Path(entry.path) for entry in it
+                    if entry.name.lower().endswith(MUSIC_EXTENSIONS) and entry.is_file()
+                )
+
+        self._file_names = [f.name for f in self.files]
+
+        # Keep the first file when names differ only by case
+        self._name_index = {}
+        for i, name in enumerate(self._file_names):
+            self._name_index.setdefault(name.lower(), i)
 
         print(f"Found {len(self.files)} files")
 
@@ -112,7 +139,10 @@ class Jukebox:
             print("0 found")
             return
 
-        for txt_file in self.music_dir.glob("*.txt"):
+        with os.scandir(self.music_dir) as it:
+            txt_files = [Path(entry.path) for entry in it if entry.name.endswith(".txt")]
+
+        for txt_file in txt_files:
             try:
                 with open(txt_file, 'r') as f:
                     first_line = f.readline().strip()
@@ -126,11 +156,7 @@ class Jukebox:
 
     def find_file_index(self, name: str) -> int:
         """Find a file index by name (case-insensitive)."""
-        name_lower = name.lower()
-        for i, f in enumerate(self.files):
-            if f.name.lower() == name_lower:
-                return i
-        return -1
+        return self._name_index.get(name.lower(), -1)
 
     def load_playlist(self, name: str) -> bool:
         """
@@ -150,66 +176,29 @@ class Jukebox:
 
         # Reset playlist state
         self.playlist_entries = []
+        self.playlist_order = []
         self.playlist_pos = 0
         self.playlist_shuffle = False
         self.playlist_loop = False
         self.playlist_active = False
         self.current_plays = 0
-        self.last_loop_count = 0
 
         print(f"Loading playlist: {name}")
 
         try:
             with open(playlist_path, 'r') as f:
-                lines = f.readlines()
+                # Check header
+                if next(f, "").strip() != "#PLAYLIST":
+                    print("ERROR: Not a playlist (missing #PLAYLIST header)")
+                    return False
+
+                # Parse lines straight from the file
+                for line in f:
+                    self._parse_playlist_line(line.strip())
         except Exception as e:
             print(f"ERROR: Failed to read playlist: {e}")
             return False
 
-        # Check header
-        if not lines or lines[0].strip() != "#PLAYLIST":
-            print("ERROR: Not a playlist (missing #PLAYLIST header)")
-            return False
-
-        # Parse lines
-        for line in lines[1:]:
-            line = line.strip()
-
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-
-            # Handle directives
-            if line.startswith(':'):
-                directive = line[1:].lower()
-                if directive == "shuffle":
-                    self.playlist_shuffle = True
-                    print("  Shuffle: ON")
-                elif directive == "loop":
-                    self.playlist_loop = True
-                    print("  Loop: ON")
-                continue
-
-            # Parse track line: filename or filename,plays
-            parts = line.split(',', 1)
-            filename = parts[0].strip()
-            plays = 1
-            if len(parts) > 1:
-                try:
-                    plays = int(parts[1].strip())
-                    if plays < 1:
-                        plays = 1
-                except ValueError:
-                    plays = 1
-
-            # Find file in our file list
-            file_idx = self.find_file_index(filename)
-            if file_idx < 0:
-                print(f"  Warning: file not found: {filename}")
-                continue
-
-            self.playlist_entries.append(PlaylistEntry(file_idx, plays))
-
         if not self.playlist_entries:
             print("ERROR: Playlist has no valid tracks")
             return False
@@ -217,11 +206,47 @@ class Jukebox:
         print(f"  Loaded {len(self.playlist_entries)} tracks")
 
         # Shuffle if requested
+        self.playlist_order = list(range(len(self.playlist_entries)))
         if self.playlist_shuffle:
-            random.shuffle(self.playlist_entries)
+            random.shuffle(self.playlist_order)
 
         return True
 
+    def _parse_playlist_line(self, line: str) -> None:
+        """Apply one stripped playlist line (directive or track)."""
+        # Skip empty lines and comments
+        if not line or line.startswith('#'):
+            return
+
+        # Handle directives
+        if line.startswith(':'):
+            spec = PLAYLIST_DIRECTIVES.get(line[1:].lower())
+            if spec:
+                attr, message = spec
+                setattr(self, attr, True)
+                print(f"  {message}")
+            return
+
+        # Parse track line: filename or filename,plays
+        parts = line.split(',', 1)
+        filename = parts[0].strip()
+        plays = 1
+        if len(parts) > 1:
+            try:
+                plays = int(parts[1].strip())
+                if plays < 1:
+                    plays = 1
+            except ValueError:
+                plays = 1
+
+        # Find file in our file list
+        file_idx = self.find_file_index(filename)
+        if file_idx < 0:
+            print(f"  Warning: file not found: {filename}")
+            return
+
+        self.playlist_entries.append(PlaylistEntry(file_idx, plays))
+
     def start_playlist(self) -> None:
         """Start playing the loaded playlist."""
         if not self.playlist_entries:
@@ -230,10 +255,9 @@ class Jukebox:
         self.playlist_active = True
         self.playlist_pos = 0
         self.current_plays = 0
-        self.last_loop_count = 0
 
         # Start first track
-        entry = self.playlist_entries[0]
+        entry = self._playlist_entry()
         self.play_by_index(entry.file_index)
 
         # Enable looping if we need to play more than once
@@ -247,7 +271,7 @@ class Jukebox:
         if not self.playlist_active or not self.playlist_entries:
             return
 
-        entry = self.playlist_entries[self.playlist_pos]
+        entry = self._playlist_entry()
         self.current_plays += 1
 
         # Check if we need to play this track again
@@ -259,13 +283,12 @@ class Jukebox:
         # Move to next track
         self.playlist_pos += 1
         self.current_plays = 0
-        self.last_loop_count = 0
 
         # Check if playlist is complete
         if self.playlist_pos >= len(self.playlist_entries):
             if self.playlist_loop:
                 # Restart playlist
-                self.playlist_pos = 0
+                self._restart_playlist()
                 print("[Playlist: restarting]")
             else:
                 # Playlist finished
@@ -277,7 +300,7 @@ class Jukebox:
         time.sleep(self.PLAYLIST_SONG_DELAY)
 
         # Play next track
-        entry = self.playlist_entries[self.playlist_pos]
+        entry = self._playlist_entry()
         self.play_by_index(entry.file_index)
 
         # Enable looping if we need to play more than once
@@ -286,12 +309,22 @@ class Jukebox:
 
         self._print_playlist_status()
 
+    def _playlist_entry(self) -> PlaylistEntry:
+        """Get the playlist entry at the current position."""
+        return self.playlist_entries[self.playlist_order[self.playlist_pos]]
+
+    def _restart_playlist(self) -> None:
+        """Go back to the first track, reshuffling for the next pass."""
+        self.playlist_pos = 0
+        if self.playlist_shuffle:
+            random.shuffle(self.playlist_order)
+
     def _print_playlist_status(self) -> None:
         """Print current playlist position."""
         if not self.playlist_active:
             return
 
-        entry = self.playlist_entries[self.playlist_pos]
+        entry = self._playlist_entry()
         status = f"[Playlist: track {self.playlist_pos + 1}/{len(self.playlist_entries)}"
         if entry.plays > 1:
             status += f", play {self.current_plays + 1}/{entry.plays}"
@@ -308,11 +341,10 @@ class Jukebox:
 
         print("Songs:")
         print("------")
-        for i, f in enumerate(self.files):
-            marker = ""
-            if i == self.current_index and self.player.is_playing:
-                marker = " [PLAYING]"
-            print(f"  {i+1:2}. {f.name}{marker}")
+        playing = self.current_index if self.player.is_playing else -1
+        for i, name in enumerate(self._file_names):
+            marker = " [PLAYING]" if i == playing else ""
+            print(f"  {i+1:2}. {name}{marker}")
 
         # Show playlists (numbered after songs)
         if self.playlists:
@@ -361,155 +393,182 @@ class Jukebox:
         Returns:
             False if should quit, True otherwise
         """
-        cmd = cmd.strip()
-        parts = cmd.lower().split(maxsplit=1)
+        parts = cmd.strip().split(maxsplit=1)
 
         if not parts:
             return True
 
-        command = parts[0]
+        command = parts[0].lower()
+        # Keep original case arg for filenames
         arg = parts[1] if len(parts) > 1 else ""
-        # Get original case arg for filenames
-        orig_parts = cmd.split(maxsplit=1)
-        orig_arg = orig_parts[1] if len(orig_parts) > 1 else ""
 
-        if command in ("help", "?"):
-            self.print_help()
+        handler = COMMANDS.get(command)
+        if handler is not None:
+            return handler(self, arg)
 
-        elif command in ("list", "ls"):
-            self.print_file_list()
+        # Just a number - play that file or playlist
+        try:
+            num = int(command)
+        except ValueError:
+            num = 0
+        if not self._play_number(num):
+            print(f"Unknown command: {command}")
+            print("Type 'help' for available commands")
 
-        elif command == "stop":
-            self.player.stop()
-            self.playlist_active = False  # Stop also exits playlist mode
-            print("Stopped")
-
-        elif command == "pause":
-            if self.player.is_paused:
-                self.player.resume()
-                print("Resumed")
-            elif self.player.is_playing:
-                self.player.pause()
-                print("Paused")
-            else:
-                print("Nothing playing")
+        return True
 
-        elif command == "loop":
-            self.player.looping = not self.player.looping
-            print(f"Loop: {'ON' if self.player.looping else 'OFF'}")
+    def _play_number(self, num: int) -> bool:
+        """
+        Play a file or playlist by its number in the list.
 
-        elif command == "info":
-            self.print_info()
+        Returns:
+            False if the number is out of range
+        """
+        if 1 <= num <= len(self.files):
+            self.playlist_active = False  # Exit playlist mode
+            self.play_by_index(num - 1)
+        elif num > len(self.files) and num <= len(self.files) + len(self.playlists):
+            # It's a playlist number
+            plist_idx = num - len(self.files) - 1
+            if self.load_playlist(self.playlists[plist_idx].stem):
+                self.start_playlist()
+        else:
+            return False
+        return True
 
-        elif command == "next":
-            if self.playlist_active:
-                # In playlist mode: advance to next track
-                self.player.stop()
-                self.playlist_pos += 1
-                self.current_plays = 0
-                self.last_loop_count = 0
-                if self.playlist_pos >= len(self.playlist_entries):
-                    if self.playlist_loop:
-                        self.playlist_pos = 0
-                    else:
-                        self.playlist_active = False
-                        print("[Playlist: finished]")
-                        return True
-                time.sleep(self.PLAYLIST_SONG_DELAY)
-                entry = self.playlist_entries[self.playlist_pos]
-                self.play_by_index(entry.file_index)
-                if entry.plays > 1 and self.player.has_loop:
-                    self.player.looping = True
-                self._print_playlist_status()
-            elif self.current_index < len(self.files) - 1:
-                self.play_by_index(self.current_index + 1)
-            else:
-                print("Already at last file")
+    def _cmd_help(self, arg: str) -> bool:
+        """Show command list."""
+        self.print_help()
+        return True
 
-        elif command == "prev":
-            if self.playlist_active:
-                # In playlist mode: go to previous track
-                self.player.stop()
-                if self.playlist_pos > 0:
-                    self.playlist_pos -= 1
-                elif self.playlist_loop:
-                    self.playlist_pos = len(self.playlist_entries) - 1
-                else:
-                    print("Already at first track")
-                    return True
-                self.current_plays = 0
-                self.last_loop_count = 0
-                time.sleep(self.PLAYLIST_SONG_DELAY)
-                entry = self.playlist_entries[self.playlist_pos]
-                self.play_by_index(entry.file_index)
-                if entry.plays > 1 and self.player.has_loop:
-                    self.player.looping = True
-                self._print_playlist_status()
-            elif self.current_index > 0:
-                self.play_by_index(self.current_index - 1)
-            else:
-                print("Already at first file")
+    def _cmd_list(self, arg: str) -> bool:
+        """List files and playlists."""
+        self.print_file_list()
+        return True
 
-        elif command == "rescan":
-            self.scan_files()
-            self.scan_playlists()
-            self.print_file_list()
+    def _cmd_stop(self, arg: str) -> bool:
+        """Stop playback and leave playlist mode."""
+        self.player.stop()
+        self.playlist_active = False  # Stop also exits playlist mode
+        print("Stopped")
+        return True
 
-        elif command == "playlist":
-            if orig_arg:
-                if self.load_playlist(orig_arg):
-                    self.start_playlist()
-            else:
-                print("Usage: playlist <name> (loads <name>.txt)")
-
-        elif command == "play":
-            if arg.isdigit():
-                num = int(arg)
-                if 1 <= num <= len(self.files):
-                    self.playlist_active = False  # Exit playlist mode
-                    self.play_by_index(num - 1)
-                elif num > len(self.files) and num <= len(self.files) + len(self.playlists):
-                    # It's a playlist number
-                    plist_idx = num - len(self.files) - 1
-                    if self.load_playlist(self.playlists[plist_idx].stem):
-                        self.start_playlist()
-                else:
-                    print(f"Invalid number. Valid range: 1-{len(self.files) + len(self.playlists)}")
-            elif orig_arg:
-                # Try to find file by name
-                file_idx = self.find_file_index(orig_arg)
-                if file_idx >= 0:
-                    self.playlist_active = False  # Exit playlist mode
-                    self.play_by_index(file_idx)
+    def _cmd_pause(self, arg: str) -> bool:
+        """Toggle pause/resume."""
+        if self.player.is_paused:
+            self.player.resume()
+            print("Resumed")
+        elif self.player.is_playing:
+            self.player.pause()
+            print("Paused")
+        else:
+            print("Nothing playing")
+        return True
+
+    def _cmd_loop(self, arg: str) -> bool:
+        """Toggle loop mode."""
+        self.player.looping = not self.player.looping
+        print(f"Loop: {'ON' if self.player.looping else 'OFF'}")
+        return True
+
+    def _cmd_info(self, arg: str) -> bool:
+        """Show current track info."""
+        self.print_info()
+        return True
+
+    def _cmd_next(self, arg: str) -> bool:
+        """Next file, or next track in playlist mode."""
+        if self.playlist_active:
+            # In playlist mode: advance to next track
+            self.player.stop()
+            self.playlist_pos += 1
+            self.current_plays = 0
+            if self.playlist_pos >= len(self.playlist_entries):
+                if self.playlist_loop:
+                    self._restart_playlist()
                 else:
-                    print(f"File not found: {orig_arg}")
+                    self.playlist_active = False
+                    print("[Playlist: finished]")
+                    return True
+            time.sleep(self.PLAYLIST_SONG_DELAY)
+            entry = self._playlist_entry()
+            self.play_by_index(entry.file_index)
+            if entry.plays > 1 and self.player.has_loop:
+                self.player.looping = True
+            self._print_playlist_status()
+        elif self.current_index < len(self.files) - 1:
+            self.play_by_index(self.current_index + 1)
+        else:
+            print("Already at last file")
+        return True
+
+    def _cmd_prev(self, arg: str) -> bool:
+        """Previous file, or previous track in playlist mode."""
+        if self.playlist_active:
+            # In playlist mode: go to previous track
+            self.player.stop()
+            if self.playlist_pos > 0:
+                self.playlist_pos -= 1
+            elif self.playlist_loop:
+                self.playlist_pos = len(self.playlist_entries) - 1
             else:
-                print("Usage: play <number> or play <filename>")
+                print("Already at first track")
+                return True
+            self.current_plays = 0
+            time.sleep(self.PLAYLIST_SONG_DELAY)
+            entry = self._playlist_entry()
+            self.play_by_index(entry.file_index)
+            if entry.plays > 1 and self.player.has_loop:
+                self.player.looping = True
+            self._print_playlist_status()
+        elif self.current_index > 0:
+            self.play_by_index(self.current_index - 1)
+        else:
+            print("Already at first file")
+        return True
 
-        elif command in ("quit", "exit", "q"):
-            return False
+    def _cmd_rescan(self, arg: str) -> bool:
+        """Rescan the music directory."""
+        self.scan_files()
+        self.scan_playlists()
+        self.print_file_list()
+        return True
 
-        elif command.isdigit():
-            # Just a number - play that file or playlist
-            num = int(command)
-            if 1 <= num <= len(self.files):
+    def _cmd_playlist(self, arg: str) -> bool:
+        """Load and start playlist <arg>.txt."""
+        if arg:
+            if self.load_playlist(arg):
+                self.start_playlist()
+        else:
+            print("Usage: playlist <name> (loads <name>.txt)")
+        return True
+
+    def _cmd_play(self, arg: str) -> bool:
+        """Play by list number or file name."""
+        try:
+            num: Optional[int] = int(arg)
+        except ValueError:
+            num = None
+
+        if num is not None:
+            if not self._play_number(num):
+                print(f"Invalid number. Valid range: 1-{len(self.files) + len(self.playlists)}")
+        elif arg:
+            # Try to find file by name
+            file_idx = self.find_file_index(arg)
+            if file_idx >= 0:
                 self.playlist_active = False  # Exit playlist mode
-                self.play_by_index(num - 1)
-            elif num > len(self.files) and num <= len(self.files) + len(self.playlists):
-                # It's a playlist number
-                plist_idx = num - len(self.files) - 1
-                if self.load_playlist(self.playlists[plist_idx].stem):
-                    self.start_playlist()
+                self.play_by_index(file_idx)
             else:
-                print(f"Unknown command: {command}")
-                print("Type 'help' for available commands")
-
+                print(f"File not found: {arg}")
         else:
-            print(f"Unknown command: {command}")
-            print("Type 'help' for available commands")
-
+            print("Usage: play <number> or play <filename>")
         return True
 
+    def _cmd_quit(self, arg: str) -> bool:
+        """Exit the jukebox."""
+        return False
+
     def print_help(self) -> None:
         """Print help message."""
         print("""
@@ -543,7 +602,7 @@ Tip: Just type a number to play that file or playlist
             print("Status: Playing")
 
         if 0 <= self.current_index < len(self.files):
-            print(f"File: {self.files[self.current_index].name}")
+            print(f"File: {self._file_names[self.current_index]}")
 
         if self.player.is_playing or self.player.is_paused:
             pos = int(self.player.position_seconds)
@@ -551,7 +610,7 @@ Tip: Just type a number to play that file or playlist
             print(f"Position: {pos // 60}:{pos % 60:02d} / {dur // 60}:{dur % 60:02d}")
 
         if self.playlist_active:
-            entry = self.playlist_entries[self.playlist_pos]
+            entry = self._playlist_entry()
             status = f"Playlist: track {self.playlist_pos + 1}/{len(self.playlist_entries)}"
             if entry.plays > 1:
                 status += f", play {self.current_plays + 1}/{entry.plays}"
@@ -564,41 +623,70 @@ Tip: Just type a number to play that file or playlist
             print(f"Loop: {'ON' if self.player.looping else 'OFF'}")
         print()
 
-    def update_thread(self) -> None:
-        """Background thread for player updates and playlist monitoring."""
-        was_playing = False
-
-        while self.running:
-            self.player.update()
-
-            # Monitor for loop events in playlist mode (for multi-play tracks)
-            if self.playlist_active and self.player.is_playing:
-                loop_count = self.player.loop_count
-                if loop_count > self.last_loop_count:
-                    self.last_loop_count = loop_count
-                    # A loop occurred - this counts as completing a play
-                    entry = self.playlist_entries[self.playlist_pos]
-                    self.current_plays += 1
-                    if self.current_plays >= entry.plays:
-                        # Done with this track, advance to next
-                        self.player.stop()
-                        self.play_next_in_playlist()
-                    else:
-                        # Still more plays needed
-                        self._print_playlist_status()
+    def _on_loop(self, loop_count: int) -> None:
+        """Engine loop callback - in playlist mode each loop completes a play."""
+        if not self.playlist_active:
+            return
 
-            # Handle playback finished
-            if was_playing and self.player.is_finished:
-                if self.playlist_active:
-                    self.play_next_in_playlist()
-                else:
-                    print("Playback finished")
-                    print("> ", end="", flush=True)
-                was_playing = False
-            elif self.player.is_playing:
-                was_playing = True
+        self.current_plays += 1
+        if self.current_plays >= self._playlist_entry().plays:
+            # Advance from update_player(), once the engine's update() returns
+            self._track_done = True
+        else:
+            # Still more plays needed
+            self._leave_prompt()
+            self._print_playlist_status()
 
-            time.sleep(0.001)  # 1ms between updates
+    def update_player(self) -> Optional[float]:
+        """
+        Advance playback and handle playlist loop/finish events.
+
+        Returns:
+            Seconds until the player next needs updating, or None if idle
+        """
+        player = self.player
+        delay = player.update()
+        snap = player.snapshot()
+
+        # Multi-play track finished its last loop (see _on_loop)
+        if self._track_done:
+            self._track_done = False
+            self._leave_prompt()
+            player.stop()
+            self.play_next_in_playlist()
+            return 0.0
+
+        # Handle playback finished
+        if self._was_playing and snap.is_finished:
+            self._leave_prompt()
+            if self.playlist_active:
+                self.play_next_in_playlist()
+            else:
+                print("Playback finished")
+            self._was_playing = False
+            return 0.0
+        elif snap.is_playing:
+            self._was_playing = True
+
+        return delay
+
+    def _show_prompt(self) -> None:
+        """Print the command prompt."""
+        print("> ", end="", flush=True)
+        self._prompt_shown = True
+
+    def _leave_prompt(self) -> None:
+        """Move off an open prompt line before printing playback messages."""
+        if self._prompt_shown:
+            print()
+            self._prompt_shown = False
+
+    @staticmethod
+    def _read_stdin_lines(lines: "queue.Queue[Optional[str]]") -> None:
+        """Thread body for the Windows fallback: queue stdin lines, then None at EOF."""
+        for line in sys.stdin:
+            lines.put(line.rstrip("\r\n"))
+        lines.put(None)
 
     def run(self) -> None:
         """Main run loop."""
@@ -624,22 +712,60 @@ Tip: Just type a number to play that file or playlist
         print("Type 'help' for commands, 'list' to see files")
         print()
 
-        # Start update thread
+        # One event loop for commands and playback: block on stdin, waking
+        # when the player's next VGM command is due (never, while idle)
         self.running = True
-        update_thread = threading.Thread(target=self.update_thread, daemon=True)
-        update_thread.start()
+        update_player = self.update_player
+        timeout: Optional[float] = None
+        selector: Optional[selectors.BaseSelector] = None
+        if sys.platform == "win32":
+            # Windows can't select() on console stdin; read it on a thread
+            # and wait on the queue instead
+            stdin_lines: "queue.Queue[Optional[str]]" = queue.Queue()
+            threading.Thread(
+                target=self._read_stdin_lines, args=(stdin_lines,), daemon=True
+            ).start()
+        else:
+            stdin_fd = sys.stdin.fileno()
+            selector = selectors.DefaultSelector()
+            selector.register(stdin_fd, selectors.EVENT_READ)
+            pending = b""
 
-        # Command loop
         try:
-            while True:
-                try:
-                    cmd = input("> ")
-                    if not self.process_command(cmd):
+            while self.running:
+                # Re-prompt after command output or playback messages
+                if not self._prompt_shown:
+                    self._show_prompt()
+                lines: List[str] = []
+                if selector is None:
+                    try:
+                        line = stdin_lines.get(timeout=timeout)
+                    except queue.Empty:
+                        pass
+                    else:
+                        if line is None:
+                            break  # EOF
+                        lines.append(line)
+                elif selector.select(timeout):
+                    data = os.read(stdin_fd, 4096)
+                    if not data:
+                        break  # EOF
+                    # Commands are whole lines; keep any partial line for later
+                    *chunks, pending = (pending + data).split(b"\n")
+                    lines = [chunk.decode(errors="replace") for chunk in chunks]
+                if lines:
+                    # Enter moved the terminal off the prompt line
+                    self._prompt_shown = False
+                for line in lines:
+                    if not self.process_command(line):
+                        self.running = False
                         break
-                except EOFError:
-                    break
+                timeout = update_player()
         except KeyboardInterrupt:
             print("\nInterrupted")
+        finally:
+            if selector is not None:
+                selector.close()
 
         # Cleanup
         self.running = False
@@ -648,6 +774,28 @@ Tip: Just type a number to play that file or playlist
         print("Goodbye!")
 
 
+# Command word -> Jukebox handler, called with the original-case argument.
+# Handlers return False to quit.
+COMMANDS = {
+    "help": Jukebox._cmd_help,
+    "?": Jukebox._cmd_help,
+    "list": Jukebox._cmd_list,
+    "ls": Jukebox._cmd_list,
+    "stop": Jukebox._cmd_stop,
+    "pause": Jukebox._cmd_pause,
+    "loop": Jukebox._cmd_loop,
+    "info": Jukebox._cmd_info,
+    "next": Jukebox._cmd_next,
+    "prev": Jukebox._cmd_prev,
+    "rescan": Jukebox._cmd_rescan,
+    "playlist": Jukebox._cmd_playlist,
+    "play": Jukebox._cmd_play,
+    "quit": Jukebox._cmd_quit,
+    "exit": Jukebox._cmd_quit,
+    "q": Jukebox._cmd_quit,
+}
+
+
 def main():
     """Entry point."""
     music_dir = sys.argv[1] if len(sys.argv) > 1 else "./music"
@@ -16,7 +16,7 @@ Basic usage:
 """
 
 from .board import GenesisBoard
-from .engine import GenesisEngine, EngineState
+from .engine import GenesisEngine, EngineState, EngineSnapshot
 from .vgm_parser import VGMParser
 from .pcm_bank import PCMDataBank
 
@@ -25,6 +25,7 @@ __all__ = [
     "GenesisBoard",
     "GenesisEngine",
     "EngineState",
+    "EngineSnapshot",
     "VGMParser",
     "PCMDataBank",
 ]
@@ -5,7 +5,7 @@ Uses SPI for the shift register and GPIO for control signals.
 """
 
 import time
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 # These imports will fail on non-Pi systems - handle gracefully for development
 try:
@@ -17,6 +17,21 @@ except ImportError:
     spidev = None  # type: ignore
     GPIO = None  # type: ignore
 
+# Preallocated one-byte buffers for writebytes2(), indexed by byte value
+_SPI_BYTES = tuple(bytes((i,)) for i in range(256))
+
+# Byte bit-reversal table (PSG data bus is wired QA→D7)
+_BITREV = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
+# One-byte PSG buffers, already bit-reversed, indexed by PSG command byte
+_PSG_SPI_BYTES = tuple(_SPI_BYTES[_BITREV[i]] for i in range(256))
+
+# Key on/off register (0x28) channel values: channels 0-2 -> 0-2, 3-5 -> 4-6
+_FM_KEYOFF_VALUES = (0, 1, 2, 4, 5, 6)
+
+# PSG maximum-attenuation commands for tone 0-2 and noise: 0x9F, 0xBF, 0xDF, 0xFF
+_PSG_SILENCE_COMMANDS = (0x9F, 0xBF, 0xDF, 0xFF)
+
 
 class GenesisBoard:
     """
@@ -38,6 +53,14 @@ class GenesisBoard:
     YM_BUSY_US = 5   # Wait after YM2612 write
     PSG_BUSY_US = 9  # Wait after PSG write
 
+    # Write methods called per register write; guarded by _bind_writers()
+    _HOT_WRITERS = ("write_ym2612", "write_dac", "write_psg")
+
+    # Chip selectors for write_batch() entries
+    CHIP_YM2612_PORT0 = 0
+    CHIP_YM2612_PORT1 = 1
+    CHIP_PSG = 2
+
     def __init__(
         self,
         wr_p: int = 17,
@@ -71,6 +94,17 @@ class GenesisBoard:
         self._spi: Optional[spidev.SpiDev] = None
         self._initialized = False
         self._in_dac_stream = False
+        # Port currently selected on A1 (-1 = unknown), to skip redundant writes
+        self._a1_port = -1
+
+        # Bound in begin() so the write paths skip module/attribute lookups
+        self._gpio_output = None
+        self._gpio_high = 1
+        self._gpio_low = 0
+        self._spi_write = None
+
+        # Until begin(), the per-write methods raise (see _bind_writers)
+        self._bind_writers(False)
 
     def begin(self) -> None:
         """
@@ -91,6 +125,7 @@ class GenesisBoard:
         GPIO.setup(self._ic_y, GPIO.OUT, initial=GPIO.HIGH)
         GPIO.setup(self._a0_y, GPIO.OUT, initial=GPIO.LOW)
         GPIO.setup(self._a1_y, GPIO.OUT, initial=GPIO.LOW)
+        self._a1_port = 0
 
         # Setup SPI
         self._spi = spidev.SpiDev()
@@ -98,7 +133,13 @@ class GenesisBoard:
         self._spi.max_speed_hz = 8_000_000  # 8 MHz - plenty fast for shift register
         self._spi.mode = 0  # CPOL=0, CPHA=0
 
+        self._gpio_output = GPIO.output
+        self._gpio_high = GPIO.HIGH
+        self._gpio_low = GPIO.LOW
+        self._spi_write = self._spi.writebytes2
+
         self._initialized = True
+        self._bind_writers(True)
 
         # Reset chips to known state
         self.reset()
@@ -111,6 +152,7 @@ class GenesisBoard:
         if _HAS_HARDWARE and self._initialized:
             GPIO.cleanup()
         self._initialized = False
+        self._bind_writers(False)
 
     def reset(self) -> None:
         """
@@ -122,9 +164,9 @@ class GenesisBoard:
 
         # Reset YM2612: pulse IC low for 500µs
         GPIO.output(self._ic_y, GPIO.LOW)
-        time.sleep(0.0005)  # 500µs
+        self._delay_us(500)
         GPIO.output(self._ic_y, GPIO.HIGH)
-        time.sleep(0.001)  # 1ms settle time
+        self._delay_us(1000)  # 1ms settle time
 
         # Silence PSG
         self.silence_psg()
@@ -143,26 +185,35 @@ class GenesisBoard:
             reg: Register address (0x00-0xFF)
             val: Value to write (0x00-0xFF)
         """
-        self._check_initialized()
-
         # FM writes invalidate DAC stream setup (changes A0/A1 pins)
         self._in_dac_stream = False
 
-        # Set port select (A1)
-        GPIO.output(self._a1_y, GPIO.HIGH if port else GPIO.LOW)
+        output = self._gpio_output
+        spi_write = self._spi_write
+        high = self._gpio_high
+        low = self._gpio_low
+        a0_y = self._a0_y
+        wr_y = self._wr_y
+
+        # Set port select (A1) - only when switching ports
+        if port != self._a1_port:
+            output(self._a1_y, high if port else low)
+            self._a1_port = port
 
         # Address phase - GenesisBoard.cpp:128-137
-        GPIO.output(self._a0_y, GPIO.LOW)  # Address mode
-        self._spi.xfer2([reg])
-        self._pulse_wr_y()
+        output(a0_y, low)  # Address mode
+        spi_write(_SPI_BYTES[reg])
+        output(wr_y, low)  # Pulse WR_Y
+        output(wr_y, high)
 
         # Wait for address latch - GenesisBoard.cpp:140
-        time.sleep(self.YM_BUSY_US / 1_000_000)
+        self._delay_us(self.YM_BUSY_US)
 
         # Data phase - GenesisBoard.cpp:143-152
-        GPIO.output(self._a0_y, GPIO.HIGH)  # Data mode
-        self._spi.xfer2([val])
-        self._pulse_wr_y()
+        output(a0_y, high)  # Data mode
+        spi_write(_SPI_BYTES[val])
+        output(wr_y, low)  # Pulse WR_Y
+        output(wr_y, high)
 
     def write_dac(self, sample: int) -> None:
         """
@@ -173,14 +224,14 @@ class GenesisBoard:
         Args:
             sample: 8-bit sample value (0x00-0xFF, 0x80 = silence)
         """
-        self._check_initialized()
-
         if not self._in_dac_stream:
             self.begin_dac_stream()
 
         # Just write data (address already set) - GenesisBoard.cpp:190-193
-        self._spi.xfer2([sample])
-        self._pulse_wr_y()
+        self._spi_write(_SPI_BYTES[sample])
+        output = self._gpio_output
+        output(self._wr_y, self._gpio_low)  # Pulse WR_Y
+        output(self._wr_y, self._gpio_high)
 
     def begin_dac_stream(self) -> None:
         """
@@ -192,11 +243,12 @@ class GenesisBoard:
 
         # Set up for DAC register (0x2A on port 0)
         GPIO.output(self._a1_y, GPIO.LOW)   # Port 0
+        self._a1_port = 0
         GPIO.output(self._a0_y, GPIO.LOW)   # Address mode
-        self._spi.xfer2([0x2A])             # DAC data register
+        self._spi.writebytes2(_SPI_BYTES[0x2A])  # DAC data register
         self._pulse_wr_y()
 
-        time.sleep(self.YM_BUSY_US / 1_000_000)
+        self._delay_us(self.YM_BUSY_US)
 
         GPIO.output(self._a0_y, GPIO.HIGH)  # Data mode for streaming
         self._in_dac_stream = True
@@ -217,14 +269,36 @@ class GenesisBoard:
         Args:
             val: PSG command byte (0x00-0xFF)
         """
+        # Shift out bit-reversed byte (GenesisBoard.cpp:240-245) and pulse WR_P
+        self._spi_write(_PSG_SPI_BYTES[val])
+        self._pulse_wr_p()
+
+    def write_batch(self, writes: Iterable[Tuple[int, int, int]]) -> None:
+        """
+        Write a run of register writes back to back.
+
+        Intended for writes that share a timestamp (e.g. everything between
+        two VGM waits), so the caller pays for one call instead of one per write.
+
+        Args:
+            writes: (chip, reg, val) tuples, where chip is CHIP_YM2612_PORT0,
+                    CHIP_YM2612_PORT1 or CHIP_PSG (reg is ignored for PSG).
+                    Port 0 writes to the DAC register (0x2A) go to write_dac().
+        """
         self._check_initialized()
 
-        # Apply bit reversal - GenesisBoard.cpp:240-245
-        val = self._reverse_bits(val)
+        write_ym2612 = self.write_ym2612
+        write_dac = self.write_dac
+        write_psg = self.write_psg
+        chip_psg = self.CHIP_PSG
 
-        # Shift out and pulse WR_P
-        self._spi.xfer2([val])
-        self._pulse_wr_p()
+        for chip, reg, val in writes:
+            if chip == chip_psg:
+                write_psg(val)
+            elif chip == 0 and reg == 0x2A:
+                write_dac(val)
+            else:
+                write_ym2612(chip, reg, val)
 
     def silence_psg(self) -> None:
         """
@@ -232,9 +306,9 @@ class GenesisBoard:
 
         Sets all 4 channels (3 tone + 1 noise) to maximum attenuation.
         """
-        # Channel attenuation commands: 0x9F, 0xBF, 0xDF, 0xFF
-        for channel in range(4):
-            self.write_psg(0x9F | (channel << 5))
+        write_psg = self.write_psg
+        for command in _PSG_SILENCE_COMMANDS:
+            write_psg(command)
             time.sleep(0.0001)  # 100µs between PSG writes
 
     def mute_all(self) -> None:
@@ -249,11 +323,9 @@ class GenesisBoard:
         self._in_dac_stream = False
 
         # Key off all FM channels (with delay between writes)
-        for channel in range(6):
-            # Channel mapping for key on/off register:
-            # Channels 0-2 use values 0-2, channels 3-5 use values 4-6
-            ch_val = channel if channel < 3 else channel + 1
-            self.write_ym2612(0, 0x28, ch_val)  # Key off (operator mask = 0)
+        write_ym2612 = self.write_ym2612
+        for ch_val in _FM_KEYOFF_VALUES:
+            write_ym2612(0, 0x28, ch_val)  # Key off (operator mask = 0)
             time.sleep(0.0001)  # 100µs between key-off writes
 
         # Silence DAC (0x80 = center/silent) and disable DAC output
@@ -267,25 +339,48 @@ class GenesisBoard:
 
     def _pulse_wr_y(self) -> None:
         """Pulse YM2612 write strobe low then high."""
-        GPIO.output(self._wr_y, GPIO.LOW)
-        GPIO.output(self._wr_y, GPIO.HIGH)
+        output = self._gpio_output
+        output(self._wr_y, self._gpio_low)
+        output(self._wr_y, self._gpio_high)
 
     def _pulse_wr_p(self) -> None:
         """Pulse PSG write strobe low then high with required delay."""
-        GPIO.output(self._wr_p, GPIO.LOW)
-        time.sleep(self.PSG_BUSY_US / 1_000_000)  # PSG needs longer pulse
-        GPIO.output(self._wr_p, GPIO.HIGH)
+        output = self._gpio_output
+        output(self._wr_p, self._gpio_low)
+        self._delay_us(self.PSG_BUSY_US)  # PSG needs longer pulse
+        output(self._wr_p, self._gpio_high)
 
     @staticmethod
-    def _reverse_bits(b: int) -> int:
+    def _delay_us(us: int) -> None:
+        """
+        Busy-wait for a few microseconds.
+
+        time.sleep() is far too coarse for the chip busy times: on Linux a
+        5µs sleep takes 50-100µs once timer slack and wakeup latency are added.
+        Also used for the reset pulse, which sleep() can stretch by milliseconds.
         """
-        Reverse bits in a byte (for PSG wiring).
+        end = time.perf_counter_ns() + us * 1000
+        while time.perf_counter_ns() < end:
+            pass
 
+    def _bind_writers(self, ready: bool) -> None:
         """
-        b = ((b & 0xF0) >> 4) | ((b & 0x0F) << 4)
-        b = ((b & 0xCC) >> 2) | ((b & 0x33) << 2)
-        b = ((b & 0xAA) >> 1) | ((b & 0x55) << 1)
-        return b
+        Switch the per-write methods between working and not-initialized.
+
+        The hot write methods skip _check_initialized(); instead, while the
+        board is not initialized, instance attributes shadow them with a stub
+        that raises. begin() removes the stubs so calls reach the real methods.
+        """
+        for name in self._HOT_WRITERS:
+            if ready:
+                self.__dict__.pop(name, None)
+            else:
+                setattr(self, name, self._not_initialized)
+
+    @staticmethod
+    def _not_initialized(*args, **kwargs) -> None:
+        """Stand-in for the write methods before begin()."""
+        raise RuntimeError("GenesisBoard.begin() must be called first")
 
     def _check_initialized(self) -> None:
         """Raise error if begin() hasn't been called."""
@@ -5,7 +5,7 @@ GenesisEngine - High-level VGM player.
 import time
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
 
 from .board import GenesisBoard
 from .vgm_parser import VGMParser
@@ -24,12 +24,36 @@ class EngineState(Enum):
     FINISHED = 3
 
 
+class EngineSnapshot(NamedTuple):
+    """Playback state captured in one call (see GenesisEngine.snapshot())."""
+
+    state: EngineState
+    loop_count: int
+    position_seconds: float
+
+    @property
+    def is_playing(self) -> bool:
+        """Check if playing when the snapshot was taken."""
+        return self.state is EngineState.PLAYING
+
+    @property
+    def is_paused(self) -> bool:
+        """Check if paused when the snapshot was taken."""
+        return self.state is EngineState.PAUSED
+
+    @property
+    def is_finished(self) -> bool:
+        """Check if finished when the snapshot was taken."""
+        return self.state is EngineState.FINISHED
+
+
 class GenesisEngine:
     """
     High-level VGM player.
 
     Manages playback timing, source selection, and state.
-    Call update() frequently (e.g., in a loop) to process commands.
+    Call update() in a loop, sleeping for the delay it returns (or until
+    next_deadline_ns) between calls.
 
     Example:
         board = GenesisBoard()
@@ -40,10 +64,17 @@ class GenesisEngine:
         player.looping = True
 
         while player.is_playing:
-            player.update()
-            time.sleep(0.001)
+            delay = player.update()
+            if delay:
+                time.sleep(delay)
     """
 
+    __slots__ = (
+        "_board", "_parser", "_source", "_state", "_looping", "on_loop",
+        "_start_time_ns", "_pause_time_ns", "_samples_played", "_waiting_samples",
+        "_next_deadline_ns",
+    )
+
     def __init__(self, board: GenesisBoard):
         """
         Initialize engine with a board reference.
@@ -58,11 +89,17 @@ class GenesisEngine:
         self._state = EngineState.STOPPED
         self._looping = False
 
+        # Called from update() with the new loop count each time playback
+        # wraps to the loop point. It must not start or stop playback itself.
+        self.on_loop: Optional[Callable[[int], None]] = None
+
         # Timing
         self._start_time_ns: int = 0
         self._pause_time_ns: int = 0
         self._samples_played: int = 0
         self._waiting_samples: int = 0
+        # perf_counter_ns() at which the next command batch is due
+        self._next_deadline_ns: int = 0
 
     def play(self, path: str) -> bool:
         """
@@ -96,6 +133,7 @@ class GenesisEngine:
         # Start playback
         self._state = EngineState.PLAYING
         self._start_time_ns = time.perf_counter_ns()
+        self._next_deadline_ns = self._start_time_ns
         self._samples_played = 0
         self._waiting_samples = 0
 
@@ -122,72 +160,151 @@ class GenesisEngine:
         # Hardware reset is more reliable than individual key-offs
         self._board.reset()
 
+        # Don't hold the closed source or the track's PCM data while idle
+        self._parser.reset()
+
         if self._source:
             self._source.close()
             self._source = None
 
     def pause(self) -> None:
         """Pause playback."""
-        if self._state == EngineState.PLAYING:
+        if self._state is EngineState.PLAYING:
             self._pause_time_ns = time.perf_counter_ns()
             self._state = EngineState.PAUSED
 
     def resume(self) -> None:
         """Resume paused playback."""
-        if self._state == EngineState.PAUSED:
+        if self._state is EngineState.PAUSED:
             # Adjust start time to account for pause duration
             pause_duration = time.perf_counter_ns() - self._pause_time_ns
             self._start_time_ns += pause_duration
+            self._next_deadline_ns += pause_duration
             self._state = EngineState.PLAYING
 
-    def update(self) -> None:
+    def update(self) -> Optional[float]:
         """
         Process VGM commands up to current time.
 
-        Must be called frequently (every loop iteration) for accurate timing.
+        Call again once the returned delay has passed (or sooner) for
+        accurate timing.
+
+        Returns:
+            Seconds until the next command is due, or None if not playing
         """
-        if self._state != EngineState.PLAYING:
-            return
+        if self._state is not EngineState.PLAYING:
+            return None
 
         # Source may have been closed by stop() in another thread
         if not self._source or not self._source.is_open:
-            return
+            return None
+
+        # Nothing can be due before the current wait ends
+        now_ns = time.perf_counter_ns()
+        if now_ns < self._next_deadline_ns:
+            return (self._next_deadline_ns - now_ns) / 1_000_000_000
 
         # Calculate target samples based on elapsed time
         # VGM runs at 44100 Hz: samples = elapsed_ns * 44100 / 1_000_000_000
         # Simplified to avoid overflow: samples = elapsed_ns * 441 / 10_000_000
-        elapsed_ns = time.perf_counter_ns() - self._start_time_ns
+        elapsed_ns = now_ns - self._start_time_ns
         target_samples = (elapsed_ns * 441) // 10_000_000
 
+        # Loop on locals; the counters are stored back on every exit
+        parser = self._parser
+        process_until_wait = parser.process_until_wait
+        playing = EngineState.PLAYING
+        played = self._samples_played
+        waiting = self._waiting_samples
+
         # Process commands until caught up
         # Wrapped in try/except to handle stop() closing source mid-operation
         try:
-            while self._samples_played < target_samples:
+            while played < target_samples:
                 # Check if we were stopped
-                if self._state != EngineState.PLAYING:
-                    return
+                if self._state is not playing:
+                    return None
 
                 # Consume waiting samples first
-                if self._waiting_samples > 0:
-                    consume = min(self._waiting_samples, target_samples - self._samples_played)
-                    self._waiting_samples -= consume
-                    self._samples_played += consume
+                if waiting > 0:
+                    consume = min(waiting, target_samples - played)
+                    waiting -= consume
+                    played += consume
                     continue
 
                 # Check for end of track
-                if self._parser.is_finished:
-                    if self._looping and self._parser.has_loop:
-                        self._parser.seek_to_loop()
+                if parser.is_finished:
+                    if self._looping and parser.has_loop:
+                        parser.seek_to_loop()
+                        if self.on_loop is not None:
+                            self._samples_played = played
+                            self._waiting_samples = waiting
+                            self.on_loop(parser.loop_count)
                     else:
                         self._state = EngineState.FINISHED
                         self._board.reset()
-                        return
+                        return None
 
                 # Process next batch of commands
-                self._waiting_samples = self._parser.process_until_wait()
+                waiting = process_until_wait()
         except (ValueError, AttributeError, OSError):
             # Source was closed by stop() - silently exit
-            return
+            return None
+        finally:
+            self._samples_played = played
+            self._waiting_samples = waiting
+
+        if self._state is not EngineState.PLAYING:
+            return None
+
+        # The next batch runs once the target passes the end of the current
+        # wait; convert that sample back to ns (rounding up) on the same clock
+        due_samples = self._samples_played + self._waiting_samples + 1
+        due_ns = self._start_time_ns + (due_samples * 10_000_000 + 440) // 441
+        self._next_deadline_ns = due_ns
+        return max(0, due_ns - time.perf_counter_ns()) / 1_000_000_000
+
+    def _position_samples(self) -> int:
+        """
+        Samples played as of now.
+
+        update() returns early until the current wait ends, so
+        _samples_played only moves at deadlines. Fill in the part of the
+        wait that has passed from the clock, as a call to update() would.
+        """
+        played = self._samples_played
+        state = self._state
+        if state is EngineState.PLAYING:
+            now_ns = time.perf_counter_ns()
+        elif state is EngineState.PAUSED:
+            now_ns = self._pause_time_ns
+        else:
+            return played
+        target_samples = ((now_ns - self._start_time_ns) * 441) // 10_000_000
+        if target_samples > played:
+            played = min(target_samples, played + self._waiting_samples)
+        return played
+
+    def snapshot(self) -> EngineSnapshot:
+        """
+        Capture state, loop count and position together.
+
+        Cheaper than reading the individual properties when several are
+        needed at once, e.g. once per update tick.
+
+        Returns:
+            EngineSnapshot of the current playback state
+        """
+        return EngineSnapshot(
+            self._state,
+            self._parser.loop_count,
+            self._position_samples() / VGM_SAMPLE_RATE,
+        )
+
+    @property
+    def next_deadline_ns(self) -> int:
+        """perf_counter_ns() time at which update() next has work to do."""
+        return self._next_deadline_ns
 
     @property
     def state(self) -> EngineState:
@@ -197,22 +314,22 @@ class GenesisEngine:
     @property
     def is_playing(self) -> bool:
         """Check if currently playing."""
-        return self._state == EngineState.PLAYING
+        return self._state is EngineState.PLAYING
 
     @property
     def is_paused(self) -> bool:
         """Check if paused."""
-        return self._state == EngineState.PAUSED
+        return self._state is EngineState.PAUSED
 
     @property
     def is_stopped(self) -> bool:
         """Check if stopped."""
-        return self._state == EngineState.STOPPED
+        return self._state is EngineState.STOPPED
 
     @property
     def is_finished(self) -> bool:
         """Check if playback finished (reached end without looping)."""
-        return self._state == EngineState.FINISHED
+        return self._state is EngineState.FINISHED
 
     @property
     def looping(self) -> bool:
@@ -232,7 +349,7 @@ class GenesisEngine:
     @property
     def position_seconds(self) -> float:
         """Get current playback position in seconds."""
-        return self._samples_played / VGM_SAMPLE_RATE
+        return self._position_samples() / VGM_SAMPLE_RATE
 
     @property
     def loop_count(self) -> int:
@@ -4,28 +4,40 @@ PCMDataBank - Storage and playback of PCM/DAC samples.
 
 
 class PCMDataBank:
-    """Storage for PCM sample data used by YM2612 DAC."""
+    """
+    Storage for PCM sample data used by YM2612 DAC.
+
+    Attributes:
+        data: Loaded sample bytes. Replace them through load_data_block().
+        position: Offset of the next sample read_byte() returns.
+            The VGM parser's DAC handler reads and advances data/position
+            directly, saving a method call per sample.
+    """
+
+    __slots__ = ("data", "position")
 
     # Silence value for DAC (center point of 8-bit unsigned)
     SILENCE = 0x80
 
     def __init__(self):
         """Initialize empty PCM data bank."""
-        self._data: bytearray = bytearray()
-        self._position: int = 0
+        self.data: bytes = b""
+        self.position: int = 0
 
     def load_data_block(self, data: bytes) -> bool:
         """
         Load PCM data from a VGM data block.
 
+        The bank never modifies its data, so bytes are kept without copying.
+
         Args:
             data: Raw PCM sample data
 
         Returns:
             True (always succeeds on Pi)
         """
-        self._data = bytearray(data)
-        self._position = 0
+        self.data = data if isinstance(data, bytes) else bytes(data)
+        self.position = 0
         return True
 
     def read_byte(self) -> int:
@@ -35,11 +47,11 @@ class PCMDataBank:
         Returns:
             Sample value (0x00-0xFF), or 0x80 (silence) if no data
         """
-        if not self._data or self._position >= len(self._data):
+        if self.position >= len(self.data):
             return self.SILENCE
 
-        val = self._data[self._position]
-        self._position += 1
+        val = self.data[self.position]
+        self.position += 1
         return val
 
     def seek(self, position: int) -> None:
@@ -49,24 +61,18 @@ class PCMDataBank:
         Args:
             position: Byte offset into PCM data
         """
-        self._position = min(position, len(self._data))
+        self.position = min(position, len(self.data))
 
     def clear(self) -> None:
         """Clear all PCM data."""
-        self._data = bytearray()
-        self._position = 0
+        self.data = b""
+        self.position = 0
 
     @property
     def has_data(self) -> bool:
         """Check if PCM data is loaded."""
-        return len(self._data) > 0
-
-    @property
-    def position(self) -> int:
-        """Current read position in PCM data."""
-        return self._position
-
+        return len(self.data) > 0
     @property
     def size(self) -> int:
         """Total size of loaded PCM data."""
-        return len(self._data)
+        return len(self.data)
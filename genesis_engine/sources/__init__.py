@@ -2,8 +2,8 @@
 VGM data source implementations.
 """
 
-from .base import VGMSource
+from .base import BufferedSource, VGMSource
 from .file_source import FileSource
 from .vgz_source import VGZSource
 
-__all__ = ["VGMSource", "FileSource", "VGZSource"]
+__all__ = ["VGMSource", "BufferedSource", "FileSource", "VGZSource"]
@@ -2,7 +2,14 @@
 VGMSource - Abstract base class for VGM data sources.
 """
 
+import mmap
+import struct
 from abc import ABC, abstractmethod
+from typing import Optional, Union
+
+# Little-endian integer decoders shared by the buffer-backed sources
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
 
 
 class VGMSource(ABC):
@@ -13,6 +20,8 @@ class VGMSource(ABC):
     (files, memory, compressed archives, etc.).
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def open(self) -> bool:
         """
@@ -96,6 +105,29 @@ class VGMSource(ABC):
 
     # Utility methods (non-abstract)
 
+    def read_byte(self) -> int:
+        """
+        Read a single byte as an integer.
+
+        Returns:
+            Byte value, or 0 if at EOF
+        """
+        data = self.read(1)
+        return data[0] if data else 0
+
+    def next_byte(self) -> int:
+        """
+        Read a single byte as an integer, reporting EOF.
+
+        Combines available() and read_byte() for callers that consume
+        the source one command at a time.
+
+        Returns:
+            Byte value, or -1 if at EOF
+        """
+        data = self.read(1)
+        return data[0] if data else -1
+
     def read_uint16(self) -> int:
         """
         Read a 16-bit little-endian unsigned integer.
@@ -128,3 +160,182 @@ class VGMSource(ABC):
             count: Number of bytes to skip
         """
         self.read(count)  # Simple implementation: just read and discard
+
+
+class BufferedSource(VGMSource):
+    """
+    Base class for sources that hold the whole stream in one buffer.
+
+    Subclasses load the buffer in open() and release it in close(); every
+    read is served here by indexing the buffer directly.
+    """
+
+    __slots__ = ("_buf", "_pos", "_data_start")
+
+    def __init__(self):
+        """Initialize with no buffer loaded."""
+        self._buf: Optional[Union[bytes, mmap.mmap]] = None
+        self._pos: int = 0  # Absolute read offset into the buffer
+        self._data_start: int = 0  # Offset where VGM data begins
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the buffer is loaded."""
+        return self._buf is not None
+
+    def read(self, count: int = 1) -> bytes:
+        """
+        Read bytes from the buffer.
+
+        Args:
+            count: Number of bytes to read
+
+        Returns:
+            Bytes read (may be fewer than requested at EOF)
+        """
+        if self._buf is None:
+            return b""
+        data = self._buf[self._pos:self._pos + count]
+        self._pos += len(data)
+        return data
+
+    def read_byte(self) -> int:
+        """
+        Read a single byte without building a bytes object.
+
+        Returns:
+            Byte value, or 0 if at EOF
+        """
+        buf = self._buf
+        if buf is None or self._pos >= len(buf):
+            return 0
+        val = buf[self._pos]
+        self._pos += 1
+        return val
+
+    def next_byte(self) -> int:
+        """
+        Read a single byte in place, reporting EOF.
+
+        Returns:
+            Byte value, or -1 if at EOF
+        """
+        buf = self._buf
+        pos = self._pos
+        if buf is None or pos >= len(buf):
+            return -1
+        self._pos = pos + 1
+        return buf[pos]
+
+    def read_uint16(self) -> int:
+        """
+        Read a 16-bit little-endian unsigned integer in place.
+
+        Returns:
+            16-bit value, or 0 if insufficient data
+        """
+        buf = self._buf
+        if buf is None:
+            return 0
+        pos = self._pos
+        if pos + 2 > len(buf):
+            self._pos = max(pos, len(buf))
+            return 0
+        self._pos = pos + 2
+        return _UINT16.unpack_from(buf, pos)[0]
+
+    def read_uint32(self) -> int:
+        """
+        Read a 32-bit little-endian unsigned integer in place.
+
+        Returns:
+            32-bit value, or 0 if insufficient data
+        """
+        buf = self._buf
+        if buf is None:
+            return 0
+        pos = self._pos
+        if pos + 4 > len(buf):
+            self._pos = max(pos, len(buf))
+            return 0
+        self._pos = pos + 4
+        return _UINT32.unpack_from(buf, pos)[0]
+
+    def skip(self, count: int) -> None:
+        """
+        Skip bytes without copying them.
+
+        Args:
+            count: Number of bytes to skip
+        """
+        if self._buf is not None:
+            self._pos = max(self._pos, min(self._pos + count, len(self._buf)))
+
+    def peek(self) -> int:
+        """
+        Peek at the next byte without advancing position.
+
+        Returns:
+            Next byte value, or -1 if at EOF
+        """
+        if self._buf is None or self._pos >= len(self._buf):
+            return -1
+        return self._buf[self._pos]
+
+    def available(self) -> bool:
+        """
+        Check if more data is available.
+
+        Returns:
+            True if not at end of the buffer
+        """
+        if self._buf is None:
+            return False
+        return self._pos < len(self._buf)
+
+    def seek(self, position: int) -> bool:
+        """
+        Seek to a position relative to data start.
+
+        Args:
+            position: Byte offset from data start
+
+        Returns:
+            True if seek succeeded
+        """
+        if self._buf is None:
+            return False
+        target = self._data_start + position
+        if target < 0 or target > len(self._buf):
+            return False
+        self._pos = target
+        return True
+
+    @property
+    def position(self) -> int:
+        """Current read position relative to data start."""
+        if self._buf is None:
+            return 0
+        return self._pos - self._data_start
+
+    @property
+    def size(self) -> int:
+        """Total size of the buffer."""
+        return len(self._buf) if self._buf is not None else 0
+
+    @property
+    def can_seek(self) -> bool:
+        """Buffered sources support seeking."""
+        return True
+
+    def set_data_start(self, offset: int) -> None:
+        """
+        Set the offset where VGM data begins.
+
+        After parsing the VGM header, set this so seek() operations
+        are relative to the data section.
+
+        Args:
+            offset: Byte offset of data section start
+        """
+        self._data_start = offset
@@ -9,10 +9,14 @@ from .fm_operator import FMOperator
 from .fm_patch import FMPatch, FMPanMode
 from .fm_frequency import (
     midi_to_fm,
+    midi_to_fm_bytes,
     write_to_channel,
     key_on,
     key_off,
     FM_FREQ_TABLE,
+    FM_FREQ_BYTES,
+    FM_CH_PORT,
+    FM_CH_OFFSET,
 )
 from .psg_frequency import (
     midi_to_tone,
@@ -23,6 +27,8 @@ from .psg_frequency import (
     play_note,
     silence,
     PSG_TONE_TABLE,
+    PSG_TONE_PACKETS,
+    PSG_VOLUME_BYTES,
 )
 from .psg_envelope import PSGEnvelope, PSGEnvelopeState, EnvelopePhase
 from .default_patches import DEFAULT_FM_PATCHES
@@ -35,10 +41,14 @@ __all__ = [
     "FMPanMode",
     # FM Frequency
     "midi_to_fm",
+    "midi_to_fm_bytes",
     "write_to_channel",
     "key_on",
     "key_off",
     "FM_FREQ_TABLE",
+    "FM_FREQ_BYTES",
+    "FM_CH_PORT",
+    "FM_CH_OFFSET",
     # PSG Frequency
     "midi_to_tone",
     "write_tone",
@@ -48,6 +58,8 @@ __all__ = [
     "play_note",
     "silence",
     "PSG_TONE_TABLE",
+    "PSG_TONE_PACKETS",
+    "PSG_VOLUME_BYTES",
     # PSG Envelope
     "PSGEnvelope",
     "PSGEnvelopeState",
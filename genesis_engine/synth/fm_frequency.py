@@ -2,7 +2,7 @@
 FM frequency utilities for YM2612.
 """
 
-from typing import Tuple, TYPE_CHECKING
+from typing import Final, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..board import GenesisBoard
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 # Each entry is (fnum, block) for the YM2612
 # Based on A4=440Hz, NTSC clock (7670453 Hz)
 # Formula: freq = (fnum * clock) / (144 * 2^(21-block))
-FM_FREQ_TABLE: list[Tuple[int, int]] = [
+FM_FREQ_TABLE: Final[Tuple[Tuple[int, int], ...]] = (
     # Octave -1 (MIDI 0-11)
     (617, 0), (654, 0), (693, 0), (734, 0), (778, 0), (824, 0),
     (873, 0), (925, 0), (980, 0), (1038, 0), (1100, 0), (1165, 0),
@@ -46,7 +46,21 @@ FM_FREQ_TABLE: list[Tuple[int, int]] = [
     # MIDI 120-127 - clamped
     (617, 7), (654, 7), (693, 7), (734, 7), (778, 7), (824, 7),
     (873, 7), (925, 7),
-]
+)
+
+# Per-channel (0-5) YM2612 port, and register offset within the port
+FM_CH_PORT: Final[Tuple[int, ...]] = (0, 0, 0, 1, 1, 1)
+FM_CH_OFFSET: Final[Tuple[int, ...]] = (0, 1, 2, 0, 1, 2)
+
+# Per-channel field of the key on/off register (0x28; channel 3 is skipped)
+_CH_KEYVAL = (0, 1, 2, 4, 5, 6)
+
+# Register values (0xA4+ch, 0xA0+ch) for each FM_FREQ_TABLE entry:
+# freq_hi = block (bits 5-3) | fnum high (bits 2-0), freq_lo = fnum low
+FM_FREQ_BYTES: Final[Tuple[Tuple[int, int], ...]] = tuple(
+    (((block & 0x07) << 3) | ((fnum >> 8) & 0x07), fnum & 0xFF)
+    for fnum, block in FM_FREQ_TABLE
+)
 
 
 def midi_to_fm(midi_note: int) -> Tuple[int, int]:
@@ -59,10 +73,26 @@ def midi_to_fm(midi_note: int) -> Tuple[int, int]:
     Returns:
         Tuple of (fnum, block)
     """
-    midi_note = max(0, min(127, midi_note))
+    if not 0 <= midi_note <= 127:
+        midi_note = 0 if midi_note < 0 else 127
     return FM_FREQ_TABLE[midi_note]
 
 
+def midi_to_fm_bytes(midi_note: int) -> Tuple[int, int]:
+    """
+    Convert MIDI note to YM2612 frequency register values.
+
+    Args:
+        midi_note: MIDI note number (0-127, 60=middle C)
+
+    Returns:
+        Tuple of (freq_hi, freq_lo) for registers 0xA4+ch and 0xA0+ch
+    """
+    if not 0 <= midi_note <= 127:
+        midi_note = 0 if midi_note < 0 else 127
+    return FM_FREQ_BYTES[midi_note]
+
+
 def write_to_channel(board: "GenesisBoard", channel: int, midi_note: int) -> None:
     """
     Write frequency to FM channel.
@@ -75,22 +105,15 @@ def write_to_channel(board: "GenesisBoard", channel: int, midi_note: int) -> Non
         channel: FM channel (0-5)
         midi_note: MIDI note number (0-127)
     """
-    fnum, block = midi_to_fm(midi_note)
-
-    # Determine port and channel offset
-    if channel < 3:
-        port = 0
-        ch_offset = channel
-    else:
-        port = 1
-        ch_offset = channel - 3
+    if channel > 5:
+        return
+    freq_hi, freq_lo = midi_to_fm_bytes(midi_note)
+    port = FM_CH_PORT[channel]
+    ch_offset = FM_CH_OFFSET[channel]
 
     # Write frequency registers
     # Register 0xA4+ch: block (bits 5-3) and fnum high (bits 2-0)
     # Register 0xA0+ch: fnum low (bits 7-0)
-    freq_hi = ((block & 0x07) << 3) | ((fnum >> 8) & 0x07)
-    freq_lo = fnum & 0xFF
-
     # IMPORTANT: Write high byte first (latches on low byte write)
     board.write_ym2612(port, 0xA4 + ch_offset, freq_hi)
     board.write_ym2612(port, 0xA0 + ch_offset, freq_lo)
@@ -108,10 +131,11 @@ def key_on(board: "GenesisBoard", channel: int, operator_mask: int = 0xF0) -> No
         channel: FM channel (0-5)
         operator_mask: Which operators to key on (default 0xF0 = all four)
     """
+    if channel > 5:
+        return
     # Key on register (0x28) on port 0
     # Bits 7-4: operator enable, bits 2-0: channel
-    ch_val = channel if channel < 3 else (channel - 3 + 4)
-    board.write_ym2612(0, 0x28, operator_mask | ch_val)
+    board.write_ym2612(0, 0x28, operator_mask | _CH_KEYVAL[channel])
 
 
 def key_off(board: "GenesisBoard", channel: int) -> None:
@@ -124,5 +148,6 @@ def key_off(board: "GenesisBoard", channel: int) -> None:
         board: GenesisBoard instance
         channel: FM channel (0-5)
     """
-    ch_val = channel if channel < 3 else (channel - 3 + 4)
-    board.write_ym2612(0, 0x28, ch_val)  # Operator mask = 0
+    if channel > 5:
+        return
+    board.write_ym2612(0, 0x28, _CH_KEYVAL[channel])  # Operator mask = 0
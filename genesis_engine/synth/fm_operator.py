@@ -3,6 +3,7 @@ FMOperator - FM synthesis operator parameters.
 """
 
 from dataclasses import dataclass
+from typing import Tuple
 
 
 @dataclass
@@ -37,19 +38,19 @@ class FMOperator:
     sl: int = 0       # Sustain Level (0-15)
     ssg: int = 0      # SSG-EG (0-15)
 
-    def to_registers(self) -> dict:
+    def to_registers(self) -> Tuple[Tuple[int, int], ...]:
         """
         Convert to YM2612 register values.
 
         Returns:
-            Dict mapping register offset to value
+            (register offset, value) pairs in register order
         """
-        return {
-            0x30: ((self.dt & 0x07) << 4) | (self.mul & 0x0F),  # DT1/MUL
-            0x40: self.tl & 0x7F,                                 # TL
-            0x50: ((self.rs & 0x03) << 6) | (self.ar & 0x1F),    # RS/AR
-            0x60: self.dr & 0x1F,                                 # D1R (AM bit not used here)
-            0x70: self.sr & 0x1F,                                 # D2R
-            0x80: ((self.sl & 0x0F) << 4) | (self.rr & 0x0F),    # D1L/RR
-            0x90: self.ssg & 0x0F,                                # SSG-EG
-        }
+        return (
+            (0x30, ((self.dt & 0x07) << 4) | (self.mul & 0x0F)),  # DT1/MUL
+            (0x40, self.tl & 0x7F),                                 # TL
+            (0x50, ((self.rs & 0x03) << 6) | (self.ar & 0x1F)),    # RS/AR
+            (0x60, self.dr & 0x1F),                                 # D1R (AM bit not used here)
+            (0x70, self.sr & 0x1F),                                 # D2R
+            (0x80, ((self.sl & 0x0F) << 4) | (self.rr & 0x0F)),    # D1L/RR
+            (0x90, self.ssg & 0x0F),                                # SSG-EG
+        )
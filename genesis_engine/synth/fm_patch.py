@@ -4,8 +4,9 @@ FMPatch - Complete FM voice/patch definition.
 
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import List, TYPE_CHECKING
+from typing import List, Tuple, TYPE_CHECKING
 
+from .fm_frequency import FM_CH_OFFSET, FM_CH_PORT
 from .fm_operator import FMOperator
 
 if TYPE_CHECKING:
@@ -26,6 +27,25 @@ class FMPanMode(IntEnum):
 # Index 2 (S2) -> offset 4, Index 3 (S4) -> offset 12
 OPERATOR_OFFSETS = [0, 8, 4, 12]
 
+# L/R bits of register 0xB4 for each FMPanMode (CENTER, LEFT, RIGHT)
+_PAN_LR = (0xC0, 0x80, 0x40)
+
+# Carrier operators for each algorithm (in op index order S1,S3,S2,S4):
+# ALG 0-3: S4 only
+# ALG 4:   S2, S4
+# ALG 5-6: S2, S3, S4
+# ALG 7:   All carriers
+_CARRIER_MASKS = (
+    (False, False, False, True),  # ALG 0
+    (False, False, False, True),  # ALG 1
+    (False, False, False, True),  # ALG 2
+    (False, False, False, True),  # ALG 3
+    (False, False, True, True),   # ALG 4
+    (False, True, True, True),    # ALG 5
+    (False, True, True, True),    # ALG 6
+    (True, True, True, True),     # ALG 7
+)
+
 
 @dataclass
 class FMPatch:
@@ -56,14 +76,34 @@ class FMPatch:
         Returns:
             Value for register 0xB4 + channel offset
         """
-        if self.pan == FMPanMode.LEFT:
-            lr = 0x80
-        elif self.pan == FMPanMode.RIGHT:
-            lr = 0x40
-        else:
-            lr = 0xC0  # Center = both speakers
+        pan = self.pan
+        # Anything but LEFT/RIGHT plays on both speakers
+        lr = _PAN_LR[pan] if 0 <= pan < len(_PAN_LR) else 0xC0
         return lr | ((self.ams & 0x03) << 4) | (self.pms & 0x07)
 
+    def to_registers(self) -> List[Tuple[int, int]]:
+        """
+        Convert to YM2612 register writes for channel 0 of a port.
+
+        Add the channel offset (0-2) to each register for the other
+        channels on the same port.
+
+        Returns:
+            List of (register, value) pairs
+        """
+        writes = []
+
+        # Operator parameters
+        for op_offset, op in zip(OPERATOR_OFFSETS, self.operators):
+            for base_reg, value in op.to_registers():
+                writes.append((base_reg + op_offset, value))
+
+        # Algorithm and feedback (register 0xB0), L/R/AMS/PMS (register 0xB4)
+        fb_alg = ((self.feedback & 0x07) << 3) | (self.algorithm & 0x07)
+        writes.append((0xB0, fb_alg))
+        writes.append((0xB4, self.get_lr_ams_pms()))
+        return writes
+
     def load_to_channel(self, board: "GenesisBoard", channel: int) -> None:
         """
         Load this patch to an FM channel.
@@ -77,32 +117,17 @@ class FMPatch:
         """
         if channel > 5:
             return
+        port = FM_CH_PORT[channel]
+        ch_offset = FM_CH_OFFSET[channel]
 
-        # Determine port and channel offset
-        if channel < 3:
-            port = 0
-            ch_offset = channel
-        else:
-            port = 1
-            ch_offset = channel - 3
-
-        # Write operator parameters
-        for op_idx, op in enumerate(self.operators):
-            op_offset = OPERATOR_OFFSETS[op_idx]
-            regs = op.to_registers()
-            for base_reg, value in regs.items():
-                reg = base_reg + op_offset + ch_offset
-                board.write_ym2612(port, reg, value)
-
-        # Write algorithm and feedback (register 0xB0 + channel)
-        fb_alg = ((self.feedback & 0x07) << 3) | (self.algorithm & 0x07)
-        board.write_ym2612(port, 0xB0 + ch_offset, fb_alg)
-
-        # Write L/R/AMS/PMS (register 0xB4 + channel)
-        board.write_ym2612(port, 0xB4 + ch_offset, self.get_lr_ams_pms())
+        # Same write order as the registers are listed: operators first,
+        # then algorithm/feedback and L/R/AMS/PMS
+        board.write_batch(
+            [(port, reg + ch_offset, value) for reg, value in self.to_registers()]
+        )
 
     @staticmethod
-    def get_carrier_mask(algorithm: int) -> List[bool]:
+    def get_carrier_mask(algorithm: int) -> Tuple[bool, bool, bool, bool]:
         """
         Get which operators are carriers for a given algorithm.
 
@@ -113,18 +138,7 @@ class FMPatch:
             algorithm: Algorithm number (0-7)
 
         Returns:
-            List of 4 bools indicating carrier status (indices match op order)
+            Tuple of 4 bools indicating carrier status (indices match op order)
         """
-        # Carrier patterns by algorithm (in op index order S1,S3,S2,S4):
-        # ALG 0-3: S4 only
-        # ALG 4:   S2, S4
-        # ALG 5-6: S2, S3, S4
-        # ALG 7:   All carriers
-        if algorithm <= 3:
-            return [False, False, False, True]
-        elif algorithm == 4:
-            return [False, False, True, True]
-        elif algorithm <= 6:
-            return [False, True, True, True]
-        else:
-            return [True, True, True, True]
+        # Masked like the 0xB0 register write, so it matches what the chip uses
+        return _CARRIER_MASKS[algorithm & 0x07]
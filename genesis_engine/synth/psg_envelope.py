@@ -20,6 +20,14 @@ class EnvelopePhase(IntEnum):
     RELEASE = 4
 
 
+# Plain-int phases for PSGEnvelopeState, which compares them every tick
+_IDLE = int(EnvelopePhase.IDLE)
+_ATTACK = int(EnvelopePhase.ATTACK)
+_DECAY = int(EnvelopePhase.DECAY)
+_SUSTAIN = int(EnvelopePhase.SUSTAIN)
+_RELEASE = int(EnvelopePhase.RELEASE)
+
+
 @dataclass
 class PSGEnvelope:
     """
@@ -39,23 +47,25 @@ class PSGEnvelope:
 class PSGEnvelopeState:
     """Runtime state for a PSG envelope."""
 
+    __slots__ = ("_envelope", "_phase", "_volume", "_accumulator")
+
     def __init__(self):
         self._envelope: Optional[PSGEnvelope] = None
-        self._phase = EnvelopePhase.IDLE
+        self._phase: int = _IDLE
         self._volume: int = 15  # 15 = silent
         self._accumulator: int = 0
 
     def trigger(self, envelope: PSGEnvelope) -> None:
         """Start the envelope from attack phase."""
         self._envelope = envelope
-        self._phase = EnvelopePhase.ATTACK
+        self._phase = _ATTACK
         self._volume = 15  # Start silent
         self._accumulator = 0
 
     def release(self) -> None:
         """Enter release phase."""
-        if self._phase != EnvelopePhase.IDLE:
-            self._phase = EnvelopePhase.RELEASE
+        if self._phase != _IDLE:
+            self._phase = _RELEASE
 
     def update(self) -> int:
         """
@@ -66,45 +76,54 @@ class PSGEnvelopeState:
         Returns:
             Volume level (0=loudest, 15=silent)
         """
-        if not self._envelope or self._phase == EnvelopePhase.IDLE:
+        envelope = self._envelope
+        phase = self._phase
+        if not envelope or phase == _IDLE:
             return 15
 
-        if self._phase == EnvelopePhase.ATTACK:
-            self._accumulator += self._envelope.attack_rate
-            steps = self._accumulator >> 4
-            self._accumulator &= 0x0F
-            self._volume = max(0, self._volume - steps)
-            if self._volume <= 0:
-                self._volume = 0
-                self._phase = EnvelopePhase.DECAY
-
-        elif self._phase == EnvelopePhase.DECAY:
-            self._accumulator += self._envelope.decay_rate
-            steps = self._accumulator >> 4
-            self._accumulator &= 0x0F
-            self._volume = min(15, self._volume + steps)
-            if self._volume >= self._envelope.sustain_level:
-                self._volume = self._envelope.sustain_level
-                self._phase = EnvelopePhase.SUSTAIN
-
-        elif self._phase == EnvelopePhase.SUSTAIN:
-            if self._envelope.loop:
-                pass  # Hold at sustain
-            else:
-                self._phase = EnvelopePhase.IDLE
-
-        elif self._phase == EnvelopePhase.RELEASE:
-            self._accumulator += self._envelope.release_rate
-            steps = self._accumulator >> 4
-            self._accumulator &= 0x0F
-            self._volume = min(15, self._volume + steps)
-            if self._volume >= 15:
-                self._volume = 15
-                self._phase = EnvelopePhase.IDLE
-
-        return self._volume
+        # Work on locals; each phase adds its rate to the 4.4 fixed-point
+        # accumulator and moves the volume by the whole steps
+        volume = self._volume
+        acc = self._accumulator
+
+        if phase == _ATTACK:
+            acc += envelope.attack_rate
+            volume -= acc >> 4
+            if volume <= 0:
+                volume = 0
+                phase = _DECAY
+
+        elif phase == _DECAY:
+            acc += envelope.decay_rate
+            volume = min(15, volume + (acc >> 4))
+            sustain_level = envelope.sustain_level
+            if volume >= sustain_level:
+                volume = sustain_level
+                phase = _SUSTAIN
+
+        elif phase == _SUSTAIN:
+            if not envelope.loop:
+                phase = _IDLE
+            # else: hold at sustain
+
+        elif phase == _RELEASE:
+            acc += envelope.release_rate
+            volume += acc >> 4
+            if volume >= 15:
+                volume = 15
+                phase = _IDLE
+
+        self._accumulator = acc & 0x0F
+        self._volume = volume
+        self._phase = phase
+        return volume
+
+    @property
+    def phase(self) -> EnvelopePhase:
+        """Current envelope phase."""
+        return EnvelopePhase(self._phase)
 
     @property
     def is_active(self) -> bool:
         """Check if envelope is still producing sound."""
-        return self._phase != EnvelopePhase.IDLE
+        return self._phase != _IDLE
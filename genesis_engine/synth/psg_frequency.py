@@ -2,7 +2,7 @@
 PSG frequency utilities for SN76489.
 """
 
-from typing import TYPE_CHECKING
+from typing import Final, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..board import GenesisBoard
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 # Formula: N = 3579545 / (32 * freq)
 # Based on NTSC PSG clock (3579545 Hz)
 # Values > 1023 are clamped to 1023
-PSG_TONE_TABLE: list[int] = [
+PSG_TONE_TABLE: Final[Tuple[int, ...]] = (
     # Octave -1 (MIDI 0-11) - too low, clamp to max
     1023, 1023, 1023, 1023, 1023, 1023, 1023, 1023, 1023, 1023, 1023, 1023,
     # Octave 0 (MIDI 12-23)
@@ -34,7 +34,21 @@ PSG_TONE_TABLE: list[int] = [
     # Octave 8+ (MIDI 108-127) - very high, values get small
     9, 9, 8, 8, 8, 7, 7, 6, 6, 6, 5, 5,
     5, 5, 4, 4, 4, 4, 3, 3,
-]
+)
+
+# Two-byte tone commands for each tone channel (0-2) and MIDI note:
+# PSG_TONE_PACKETS[channel][midi_note] = (1 CC 0 DDDD, 0 0 DDDDDD)
+PSG_TONE_PACKETS: Final[Tuple[Tuple[Tuple[int, int], ...], ...]] = tuple(
+    tuple((0x80 | (channel << 5) | (tone & 0x0F), (tone >> 4) & 0x3F) for tone in PSG_TONE_TABLE)
+    for channel in range(3)
+)
+
+# Volume commands for each channel (0-3) and attenuation (0-15):
+# PSG_VOLUME_BYTES[channel][volume] = 1 CC 1 VVVV
+PSG_VOLUME_BYTES: Final[Tuple[Tuple[int, ...], ...]] = tuple(
+    tuple(0x90 | (channel << 5) | volume for volume in range(16))
+    for channel in range(4)
+)
 
 
 def midi_to_tone(midi_note: int) -> int:
@@ -47,7 +61,8 @@ def midi_to_tone(midi_note: int) -> int:
     Returns:
         10-bit tone value (1-1023)
     """
-    midi_note = max(0, min(127, midi_note))
+    if not 0 <= midi_note <= 127:
+        midi_note = 0 if midi_note < 0 else 127
     return PSG_TONE_TABLE[midi_note]
 
 
@@ -89,8 +104,11 @@ def write_to_channel(board: "GenesisBoard", channel: int, midi_note: int) -> Non
     """
     if channel > 2:
         return
-    tone = midi_to_tone(midi_note)
-    write_tone(board, channel, tone)
+    if not 0 <= midi_note <= 127:
+        midi_note = 0 if midi_note < 0 else 127
+    first, second = PSG_TONE_PACKETS[channel][midi_note]
+    board.write_psg(first)
+    board.write_psg(second)
 
 
 def set_volume(board: "GenesisBoard", channel: int, volume: int) -> None:
@@ -108,7 +126,7 @@ def set_volume(board: "GenesisBoard", channel: int, volume: int) -> None:
         volume = 15
 
     # SN76489 volume format: 1 CC 1 VVVV (CC=channel, VVVV=attenuation)
-    board.write_psg(0x90 | (channel << 5) | volume)
+    board.write_psg(PSG_VOLUME_BYTES[channel][volume])
 
 
 def set_noise(board: "GenesisBoard", white: bool, shift: int) -> None:
@@ -2,7 +2,8 @@
 VGMParser - Parse and execute VGM commands.
 """
 
-from typing import Callable, Optional
+import struct
+from typing import Callable, List, Optional
 
 from .board import GenesisBoard
 from .pcm_bank import PCMDataBank
@@ -34,6 +35,51 @@ from .vgm_commands import (
 )
 
 
+# Fixed VGM header fields 0x00-0x37 as little-endian uint32s, indexed by offset // 4
+_HEADER = struct.Struct("<14I")
+
+
+def _build_skip_lengths() -> bytes:
+    """Operand byte counts for commands the parser doesn't act on."""
+    lengths = bytearray(256)
+    for cmd in range(0x30, 0x40):
+        lengths[cmd] = 1  # 1-byte data
+    for cmd in range(0x40, 0x4F):
+        lengths[cmd] = 2  # 2-byte data
+    lengths[0x4F] = 1  # Game Gear stereo
+    for cmd in range(0x51, 0x60):
+        lengths[cmd] = 2  # Other chips (2-byte)
+    for cmd in range(0xA0, 0xC0):
+        lengths[cmd] = 2  # Other chips (2-byte)
+    for cmd in range(0xC0, 0xE0):
+        lengths[cmd] = 3  # Other chips (3-byte)
+    for cmd in range(0xE1, 0x100):
+        lengths[cmd] = 4  # Other chips (4-byte)
+    return bytes(lengths)
+
+
+# Bytes to skip after each unhandled command (0 = unknown, skip nothing)
+_SKIP_LEN = _build_skip_lengths()
+
+
+def _build_psg_attenuation() -> bytes:
+    """PSG bytes with volume latches turned down 2 steps - VGMParser.cpp:148-154"""
+    table = bytearray(256)
+    for val in range(256):
+        if (val & 0x90) == 0x90:
+            atten = val & 0x0F
+            if atten <= 13:
+                atten += 2
+            table[val] = (val & 0xF0) | atten
+        else:
+            table[val] = val
+    return bytes(table)
+
+
+# PSG write bytes as sent when FM is also present, indexed by the VGM byte
+_PSG_ATTENUATED = _build_psg_attenuation()
+
+
 class VGMParser:
     """
     VGM format parser and command dispatcher.
@@ -42,6 +88,12 @@ class VGMParser:
     to the GenesisBoard. Handles timing by returning wait sample counts.
     """
 
+    __slots__ = (
+        "_board", "_source", "_pcm_bank", "_version", "_total_samples", "_loop_offset",
+        "_loop_samples", "_data_offset", "_has_ym2612", "_has_sn76489", "_finished",
+        "_loop_count", "_dispatch", "_has_loop",
+    )
+
     def __init__(self, board: GenesisBoard):
         """
         Initialize parser with a board reference.
@@ -58,6 +110,7 @@ class VGMParser:
         self._total_samples: int = 0
         self._loop_offset: int = 0
         self._loop_samples: int = 0
+        self._has_loop: bool = False
         self._data_offset: int = 0
         self._has_ym2612: bool = False
         self._has_sn76489: bool = False
@@ -66,6 +119,34 @@ class VGMParser:
         self._finished: bool = False
         self._loop_count: int = 0
 
+        # Command dispatch table, indexed by command byte
+        self._dispatch: List[Callable[[int], Optional[int]]] = [self._op_skip] * 256
+        self._dispatch[VGM_CMD_PSG_WRITE] = self._op_psg_write
+        self._dispatch[VGM_CMD_YM2612_PORT0] = self._op_ym2612_port0
+        self._dispatch[VGM_CMD_YM2612_PORT1] = self._op_ym2612_port1
+        self._dispatch[VGM_CMD_WAIT_N] = self._op_wait_n
+        self._dispatch[VGM_CMD_WAIT_NTSC] = self._op_wait_ntsc
+        self._dispatch[VGM_CMD_WAIT_PAL] = self._op_wait_pal
+        self._dispatch[VGM_CMD_END] = self._op_end
+        self._dispatch[VGM_CMD_DATA_BLOCK] = self._op_data_block
+        self._dispatch[VGM_CMD_PCM_SEEK] = self._op_pcm_seek
+        for cmd in range(VGM_CMD_WAIT_SHORT_BASE, VGM_CMD_WAIT_SHORT_BASE + 16):
+            self._dispatch[cmd] = self._op_wait_short
+        for cmd in range(VGM_CMD_DAC_WAIT_BASE, VGM_CMD_DAC_WAIT_BASE + 16):
+            self._dispatch[cmd] = self._op_dac_wait
+
+    def reset(self) -> None:
+        """
+        Detach the source and clear playback state.
+
+        Releases the PCM data bank. Header data is kept until the next
+        parse_header().
+        """
+        self._source = None
+        self._finished = False
+        self._loop_count = 0
+        self._pcm_bank.clear()
+
     def set_source(self, source: VGMSource) -> None:
         """
         Set the VGM data source.
@@ -73,10 +154,8 @@ class VGMParser:
         Args:
             source: VGMSource instance to read from
         """
+        self.reset()
         self._source = source
-        self._finished = False
-        self._loop_count = 0
-        self._pcm_bank.clear()
 
     def parse_header(self) -> bool:
         """
@@ -91,42 +170,38 @@ class VGMParser:
         if not self._source or not self._source.is_open:
             return False
 
+        # Whole fixed header (0x00-0x37) in one read. As with read_uint32(),
+        # fields cut off by EOF read as 0.
+        header = self._source.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            header = header[:len(header) & ~3].ljust(_HEADER.size, b"\x00")
+        fields = _HEADER.unpack(header)
+
         # Verify magic number
-        magic = self._source.read_uint32()
-        if magic != VGM_MAGIC:
+        if fields[0] != VGM_MAGIC:
             return False
 
-        # Skip to version (offset 0x08)
-        self._source.skip(4)  # Skip EOF offset
-        self._version = self._source.read_uint32()
-
-        # SN76489 clock (offset 0x0C)
-        sn76489_clock = self._source.read_uint32()
-        self._has_sn76489 = sn76489_clock != 0
+        self._version = fields[VGM_HEADER_VERSION >> 2]
+        self._has_sn76489 = fields[VGM_HEADER_SN76489_CLOCK >> 2] != 0
+        self._total_samples = fields[VGM_HEADER_TOTAL_SAMPLES >> 2]
 
-        # Skip YM2413 clock (0x10), GD3 offset (0x14)
-        self._source.skip(8)
-
-        # Total samples (offset 0x18)
-        self._total_samples = self._source.read_uint32()
-
-        # Loop offset (offset 0x1C) - relative to 0x1C
-        loop_offset_rel = self._source.read_uint32()
+        # Loop offset - relative to 0x1C
+        loop_offset_rel = fields[VGM_HEADER_LOOP_OFFSET >> 2]
         self._loop_offset = (0x1C + loop_offset_rel) if loop_offset_rel else 0
+        self._loop_samples = fields[VGM_HEADER_LOOP_SAMPLES >> 2]
+        self._has_loop = self._loop_offset > 0 and self._loop_samples > 0
 
-        # Loop samples (offset 0x20)
-        self._loop_samples = self._source.read_uint32()
+        self._has_ym2612 = fields[VGM_HEADER_YM2612_CLOCK >> 2] != 0
 
-        # Skip to YM2612 clock (offset 0x2C)
-        self._source.skip(8)  # Skip rate (0x24), SN flags (0x28)
-        ym2612_clock = self._source.read_uint32()
-        self._has_ym2612 = ym2612_clock != 0
+        # Apply PSG attenuation if both FM and PSG present
+        self._dispatch[VGM_CMD_PSG_WRITE] = (
+            self._op_psg_write_attenuated if self._has_ym2612 else self._op_psg_write
+        )
 
-        # Data offset (offset 0x34) - v1.50+ only
-        self._source.skip(4)  # Skip YM2151 clock (0x30)
-        if self._version >= 0x150:
-            data_offset_rel = self._source.read_uint32()
-            self._data_offset = 0x34 + data_offset_rel if data_offset_rel else VGM_DEFAULT_DATA_OFFSET
+        # Data offset - relative to 0x34, v1.50+ only
+        data_offset_rel = fields[VGM_HEADER_DATA_OFFSET >> 2]
+        if self._version >= 0x150 and data_offset_rel:
+            self._data_offset = VGM_HEADER_DATA_OFFSET + data_offset_rel
         else:
             self._data_offset = VGM_DEFAULT_DATA_OFFSET
 
@@ -149,108 +224,114 @@ class VGMParser:
         if not self._source or self._finished:
             return 0
 
-        while self._source.available():
-            data = self._source.read(1)
-            if not data:
-                self._finished = True
-                return 0
-
-            cmd = data[0]
-
-            # PSG write - VGMParser.cpp:145-155
-            if cmd == VGM_CMD_PSG_WRITE:
-                val = self._source.read(1)[0]
-                # Apply PSG attenuation if both FM and PSG present
-                # VGMParser.cpp:148-154
-                if self._has_ym2612 and (val & 0x90) == 0x90:
-                    atten = val & 0x0F
-                    if atten <= 13:
-                        atten += 2
-                    val = (val & 0xF0) | atten
-                self._board.write_psg(val)
-
-            # YM2612 port 0 - VGMParser.cpp:157-165
-            elif cmd == VGM_CMD_YM2612_PORT0:
-                reg = self._source.read(1)[0]
-                val = self._source.read(1)[0]
-                if reg == YM2612_REG_DAC_DATA:
-                    self._board.write_dac(val)
-                else:
-                    self._board.write_ym2612(0, reg, val)
-
-            # YM2612 port 1 - VGMParser.cpp:167-175
-            elif cmd == VGM_CMD_YM2612_PORT1:
-                reg = self._source.read(1)[0]
-                val = self._source.read(1)[0]
-                self._board.write_ym2612(1, reg, val)
-
-            # Wait N samples - VGMParser.cpp:177-182
-            elif cmd == VGM_CMD_WAIT_N:
-                return self._source.read_uint16()
-
-            # Wait NTSC frame - VGMParser.cpp:184-186
-            elif cmd == VGM_CMD_WAIT_NTSC:
-                return VGM_WAIT_NTSC
-
-            # Wait PAL frame - VGMParser.cpp:188-190
-            elif cmd == VGM_CMD_WAIT_PAL:
-                return VGM_WAIT_PAL
-
-            # End of data - VGMParser.cpp:192-196
-            elif cmd == VGM_CMD_END:
-                self._finished = True
-                return 0
-
-            # Data block (PCM data) - VGMParser.cpp:198-230
-            elif cmd == VGM_CMD_DATA_BLOCK:
-                self._source.read(1)  # Skip 0x66 marker
-                data_type = self._source.read(1)[0]
-                data_size = self._source.read_uint32()
-                if data_type == 0x00:  # YM2612 PCM data
-                    pcm_data = self._source.read(data_size)
-                    self._pcm_bank.load_data_block(pcm_data)
-                else:
-                    self._source.skip(data_size)
-
-            # Short waits 0x70-0x7F - VGMParser.cpp:232-236
-            elif 0x70 <= cmd <= 0x7F:
-                return (cmd & 0x0F) + 1
-
-            # DAC write + wait 0x80-0x8F - VGMParser.cpp:238-250
-            elif 0x80 <= cmd <= 0x8F:
-                sample = self._pcm_bank.read_byte()
-                self._board.write_dac(sample)
-                wait = cmd & 0x0F
-                if wait > 0:
-                    return wait
-
-            # PCM seek - VGMParser.cpp:252-260
-            elif cmd == VGM_CMD_PCM_SEEK:
-                offset = self._source.read_uint32()
-                self._pcm_bank.seek(offset)
-
-            # Unknown commands - skip based on known patterns
-            else:
-                # Handle other chip writes by skipping appropriate bytes
-                if 0x30 <= cmd <= 0x3F:
-                    self._source.skip(1)  # 1-byte data
-                elif 0x40 <= cmd <= 0x4E:
-                    self._source.skip(2)  # 2-byte data
-                elif cmd == 0x4F:
-                    self._source.skip(1)  # Game Gear stereo
-                elif 0x51 <= cmd <= 0x5F:
-                    self._source.skip(2)  # Other chips (2-byte)
-                elif 0xA0 <= cmd <= 0xBF:
-                    self._source.skip(2)  # Other chips (2-byte)
-                elif 0xC0 <= cmd <= 0xDF:
-                    self._source.skip(3)  # Other chips (3-byte)
-                elif 0xE1 <= cmd <= 0xFF:
-                    self._source.skip(4)  # Other chips (4-byte)
-                # else: Unknown, skip nothing
+        source = self._source
+        dispatch = self._dispatch
+
+        # Handlers return a wait in samples, or None to keep going
+        while True:
+            cmd = source.next_byte()
+            if cmd < 0:
+                break
+            wait = dispatch[cmd](cmd)
+            if wait is not None:
+                return wait
 
         self._finished = True
         return 0
 
+    # =========================================================================
+    # Command handlers, indexed by command byte in _dispatch
+    # =========================================================================
+
+    def _op_psg_write(self, cmd: int) -> Optional[int]:
+        """PSG write - VGMParser.cpp:145-155"""
+        self._board.write_psg(self._source.read_byte())
+        return None
+
+    def _op_psg_write_attenuated(self, cmd: int) -> Optional[int]:
+        """PSG write with volume turned down to sit under FM - VGMParser.cpp:148-154"""
+        self._board.write_psg(_PSG_ATTENUATED[self._source.read_byte()])
+        return None
+
+    def _op_ym2612_port0(self, cmd: int) -> Optional[int]:
+        """YM2612 port 0 - VGMParser.cpp:157-165"""
+        source = self._source
+        reg = source.read_byte()
+        val = source.read_byte()
+        if reg == YM2612_REG_DAC_DATA:
+            self._board.write_dac(val)
+        else:
+            self._board.write_ym2612(0, reg, val)
+        return None
+
+    def _op_ym2612_port1(self, cmd: int) -> Optional[int]:
+        """YM2612 port 1 - VGMParser.cpp:167-175"""
+        source = self._source
+        reg = source.read_byte()
+        val = source.read_byte()
+        self._board.write_ym2612(1, reg, val)
+        return None
+
+    def _op_wait_n(self, cmd: int) -> Optional[int]:
+        """Wait N samples - VGMParser.cpp:177-182"""
+        return self._source.read_uint16()
+
+    def _op_wait_ntsc(self, cmd: int) -> Optional[int]:
+        """Wait NTSC frame - VGMParser.cpp:184-186"""
+        return VGM_WAIT_NTSC
+
+    def _op_wait_pal(self, cmd: int) -> Optional[int]:
+        """Wait PAL frame - VGMParser.cpp:188-190"""
+        return VGM_WAIT_PAL
+
+    def _op_end(self, cmd: int) -> Optional[int]:
+        """End of data - VGMParser.cpp:192-196"""
+        self._finished = True
+        return 0
+
+    def _op_data_block(self, cmd: int) -> Optional[int]:
+        """Data block (PCM data) - VGMParser.cpp:198-230"""
+        source = self._source
+        source.skip(1)  # Skip 0x66 marker
+        data_type = source.read_byte()
+        data_size = source.read_uint32()
+        if data_type == 0x00:  # YM2612 PCM data
+            pcm_data = source.read(data_size)
+            self._pcm_bank.load_data_block(pcm_data)
+        else:
+            source.skip(data_size)
+        return None
+
+    def _op_wait_short(self, cmd: int) -> Optional[int]:
+        """Short waits 0x70-0x7F - VGMParser.cpp:232-236"""
+        return (cmd & 0x0F) + 1
+
+    def _op_dac_wait(self, cmd: int) -> Optional[int]:
+        """DAC write + wait 0x80-0x8F - VGMParser.cpp:238-250"""
+        # PCMDataBank.read_byte() inlined; this runs once per DAC sample
+        pcm = self._pcm_bank
+        position = pcm.position
+        data = pcm.data
+        if position < len(data):
+            pcm.position = position + 1
+            self._board.write_dac(data[position])
+        else:
+            self._board.write_dac(PCMDataBank.SILENCE)
+        wait = cmd & 0x0F
+        return wait if wait > 0 else None
+
+    def _op_pcm_seek(self, cmd: int) -> Optional[int]:
+        """PCM seek - VGMParser.cpp:252-260"""
+        self._pcm_bank.seek(self._source.read_uint32())
+        return None
+
+    def _op_skip(self, cmd: int) -> Optional[int]:
+        """Other chips' commands - skip their operands via _SKIP_LEN"""
+        length = _SKIP_LEN[cmd]
+        if length:
+            self._source.skip(length)
+        return None
+
     def seek_to_loop(self) -> bool:
         """
         Seek to the loop point.
@@ -258,7 +339,7 @@ class VGMParser:
         Returns:
             True if loop point exists and seek succeeded
         """
-        if not self._source or not self.has_loop:
+        if not self._source or not self._has_loop:
             return False
 
         # Calculate loop offset relative to data start
@@ -277,7 +358,7 @@ class VGMParser:
     @property
     def has_loop(self) -> bool:
         """Check if VGM has a loop point."""
-        return self._loop_offset > 0 and self._loop_samples > 0
+        return self._has_loop
 
     @property
     def loop_count(self) -> int:
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""GenesisEngine playback test with a fake board (no hardware needed).
+
+Plays a short VGM file in real time and checks the chip writes, the reset
+at the end, the reported position and loop handling.
+"""
+
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, '.')
+
+from genesis_engine.engine import GenesisEngine, EngineState
+from genesis_engine.vgm_commands import VGM_SAMPLE_RATE
+
+INTRO = b"\x52\x28\xF0" + b"\x62"                   # Key on, wait 735
+LOOP = b"\x52\xA4\x22" + b"\x61" + struct.pack("<H", 441)  # Write, wait 441
+INTRO_SAMPLES = 735
+LOOP_SAMPLES = 441
+TOTAL_SAMPLES = INTRO_SAMPLES + LOOP_SAMPLES
+
+
+class FakeBoard:
+    """Stands in for GenesisBoard, recording writes and resets."""
+
+    def __init__(self):
+        self.log = []
+
+    def reset(self):
+        self.log.append(("reset",))
+
+    def write_ym2612(self, port, reg, val):
+        self.log.append(("fm", port, reg, val))
+
+    def write_psg(self, val):
+        self.log.append(("psg", val))
+
+    def write_dac(self, val):
+        self.log.append(("dac", val))
+
+
+def build_vgm():
+    """Return a YM2612-only VGM file with a loop point after the intro."""
+    header = bytearray(0x40)
+    body = INTRO + LOOP + b"\x66"
+    struct.pack_into("<4sII", header, 0x00, b"Vgm ", 0x40 + len(body) - 4, 0x150)
+    struct.pack_into("<III", header, 0x18, TOTAL_SAMPLES,
+                     0x40 + len(INTRO) - 0x1C, LOOP_SAMPLES)
+    struct.pack_into("<I", header, 0x2C, 7670453)
+    struct.pack_into("<I", header, 0x34, 0x40 - 0x34)
+    return bytes(header) + body
+
+
+def run(engine, until, timeout=2.0):
+    """Call update() as a player would until until() is true."""
+    deadline = time.monotonic() + timeout
+    while not until():
+        assert time.monotonic() < deadline, "playback did not progress"
+        delay = engine.update()
+        if delay:
+            time.sleep(delay)
+
+
+def main():
+    """Run the checks, printing the result of each."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "test.vgm"
+        path.write_bytes(build_vgm())
+
+        board = FakeBoard()
+        engine = GenesisEngine(board)
+
+        print("Testing playback to the end...")
+        assert engine.play(str(path)), "play failed"
+        assert engine.state is EngineState.PLAYING
+        start = time.perf_counter()
+        while len(board.log) < 2:  # Until the intro write, then into its wait
+            engine.update()
+        time.sleep(0.008)
+        position = engine.position_seconds
+        assert 0 < position < INTRO_SAMPLES / VGM_SAMPLE_RATE, position
+        print(f"  Position moves during a wait ({position:.4f}s)")
+
+        run(engine, lambda: engine.state is not EngineState.PLAYING)
+        elapsed = time.perf_counter() - start
+        assert engine.state is EngineState.FINISHED
+        assert elapsed >= TOTAL_SAMPLES / VGM_SAMPLE_RATE, elapsed
+        assert board.log == [
+            ("reset",),               # play() stops first
+            ("fm", 0, 0x28, 0xF0),
+            ("fm", 0, 0xA4, 0x22),
+            ("reset",),               # Silenced at the end
+        ], board.log
+        assert engine.position_seconds == TOTAL_SAMPLES / VGM_SAMPLE_RATE
+        print(f"  Finished after {elapsed:.3f}s, writes in order")
+
+        print("\nTesting looping...")
+        board.log.clear()
+        loops = []
+        engine.looping = True
+        engine.on_loop = lambda count: loops.append((count, engine.position_seconds))
+        assert engine.play(str(path)), "play failed"
+        run(engine, lambda: len(loops) >= 2)
+        assert [count for count, _ in loops] == [1, 2]
+        assert loops[0][1] == TOTAL_SAMPLES / VGM_SAMPLE_RATE, loops
+        assert loops[1][1] == (TOTAL_SAMPLES + LOOP_SAMPLES) / VGM_SAMPLE_RATE, loops
+        assert engine.loop_count == 2
+        print(f"  Looped {engine.loop_count} times")
+
+        engine.stop()
+        assert engine.state is EngineState.STOPPED
+        assert engine.update() is None
+        assert board.log == [("reset",), ("fm", 0, 0x28, 0xF0)] + \
+            [("fm", 0, 0xA4, 0x22)] * 3 + [("reset",)], board.log
+        print("  Stopped and reset")
+
+    print("\n" + "="*50)
+    print("All engine tests passed!")
+    print("="*50)
+
+
+if __name__ == "__main__":
+    main()